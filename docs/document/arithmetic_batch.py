@@ -0,0 +1,144 @@
+"""Element-wise variants of the functions in arithmetic.py.
+
+The functions accept two sequences of the same length and return the results
+as NumPy array or, if NumPy is not installed, as array of floating point
+numbers.
+"""
+
+import math
+import operator
+import sys
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+ON_ZERO = ("raise", "nan", "mask")
+
+
+def _check(xs, ys):
+    if len(xs) != len(ys):
+        raise ValueError(f"sequences have different lengths: {len(xs)}, {len(ys)}")
+
+
+def _apply(ufunc, function, xs, ys):
+    _check(xs, ys)
+    if np is not None:
+        return ufunc(np.asarray(xs, dtype=float), np.asarray(ys, dtype=float))
+    return array("d", map(function, xs, ys))
+
+
+def add(xs, ys):
+    """
+    >>> add([7, 1], [6, 2]).tolist()
+    [13.0, 3.0]
+    """
+    return _apply(np and np.add, operator.add, xs, ys)
+
+
+def subtract(xs, ys):
+    """
+    >>> subtract([7, 1], [6, 2]).tolist()
+    [1.0, -1.0]
+    """
+    return _apply(np and np.subtract, operator.sub, xs, ys)
+
+
+def multiply(xs, ys):
+    """
+    >>> multiply([7, 1], [6, 2]).tolist()
+    [42.0, 2.0]
+    """
+    return _apply(np and np.multiply, operator.mul, xs, ys)
+
+
+def _divide_or_nan(x, y):
+    return x / y if y else math.nan
+
+
+def divide(xs, ys, on_zero="raise"):
+    """Divides the elements of the first sequence by those of the second
+
+    on_zero determines what happens when dividing by zero:
+
+    ``"raise"``
+        raises a single ZeroDivisionError for the first zero
+    ``"nan"``
+        returns NaN for these elements
+    ``"mask"``
+        returns the quotients as with ``"nan"`` and additionally a mask that is
+        true for these elements
+
+    >>> [round(q, 8) for q in divide([7, 1], [-6.0, 4]).tolist()]
+    [-1.16666667, 0.25]
+    >>> divide([7, 1], [2, 0])
+    Traceback (most recent call last):
+      File "<stdin>", line 1, in <module>
+    ZeroDivisionError: division by zero at index 1
+    >>> divide([7, 1], [2, 0], on_zero="nan").tolist()
+    [3.5, nan]
+    >>> quotients, mask = divide([7, 1], [2, 0], on_zero="mask")
+    >>> [q for q, masked in zip(quotients.tolist(), mask) if not masked]
+    [3.5]
+    """
+    if on_zero not in ON_ZERO:
+        raise ValueError(f"on_zero must be one of {ON_ZERO}, not {on_zero!r}")
+    _check(xs, ys)
+    if np is not None:
+        xs = np.asarray(xs, dtype=float)
+        ys = np.asarray(ys, dtype=float)
+        zero = ys == 0
+        if on_zero == "raise" and zero.any():
+            index = int(zero.argmax())
+            raise ZeroDivisionError(f"division by zero at index {index}")
+        with np.errstate(divide="ignore", invalid="ignore"):
+            quotients = xs / ys
+        quotients[zero] = np.nan
+    else:
+        try:
+            quotients = array("d", map(operator.truediv, xs, ys))
+            zero = array("b", bytes(len(quotients)))
+        except ZeroDivisionError:
+            # Only now is it worth checking each element
+            zero = array("b", (y == 0 for y in ys))
+            if on_zero == "raise":
+                raise ZeroDivisionError(
+                    f"division by zero at index {zero.index(True)}"
+                ) from None
+            quotients = array("d", map(_divide_or_nan, xs, ys))
+    if on_zero == "mask":
+        return quotients, zero
+    return quotients
+
+
+def benchmark(count=1_000_000):
+    """Compare the functions with calls of the arithmetic functions in a loop."""
+    import arithmetic
+
+    xs = [float(i) for i in range(count)]
+    ys = [float(i % 100 + 1) for i in range(count)]
+    inputs = {"list": (xs, ys), "array": (array("d", xs), array("d", ys))}
+    print(f"{'':10} {'loop':>10} {'list':>10} {'array':>10}")
+    for name in ("add", "subtract", "multiply", "divide"):
+        scalar = getattr(arithmetic, name)
+        start = time.perf_counter()
+        [scalar(x, y) for x, y in zip(xs, ys)]
+        durations = [time.perf_counter() - start]
+        for batch_xs, batch_ys in inputs.values():
+            start = time.perf_counter()
+            globals()[name](batch_xs, batch_ys)
+            durations.append(time.perf_counter() - start)
+        print(f"{name:10}", *(f"{duration:8.3f} s" for duration in durations))
+    print(f"NumPy: {'yes' if np is not None else 'no'}")
+
+
+if __name__ == "__main__":
+    if "--benchmark" in sys.argv:
+        benchmark()
+    else:
+        import doctest
+
+        doctest.testmod(verbose=True)
@@ -0,0 +1,78 @@
+import math
+import unittest
+from unittest import mock
+
+import arithmetic_batch
+
+# Each test runs with NumPy, if installed, and with array
+BACKENDS = {arithmetic_batch.np, None}
+
+
+class TestArithmeticBatch(unittest.TestCase):
+    def test_operations(self):
+        for np in BACKENDS:
+            with (
+                self.subTest(numpy=np is not None),
+                mock.patch.object(arithmetic_batch, "np", np),
+            ):
+                self.assertEqual(arithmetic_batch.add([7, 1], [6, 2]).tolist(), [13, 3])
+                self.assertEqual(
+                    arithmetic_batch.subtract([7, 1], [6, 2]).tolist(), [1, -1]
+                )
+                self.assertEqual(
+                    arithmetic_batch.multiply([7, 1], [6, 2]).tolist(), [42, 2]
+                )
+                self.assertEqual(
+                    arithmetic_batch.divide([42, 1], [7, 4]).tolist(), [6, 0.25]
+                )
+
+    def test_different_lengths(self):
+        for np in BACKENDS:
+            with (
+                self.subTest(numpy=np is not None),
+                mock.patch.object(arithmetic_batch, "np", np),
+            ):
+                with self.assertRaises(ValueError):
+                    arithmetic_batch.add([1, 2], [1])
+
+    def test_divide_raise(self):
+        for np in BACKENDS:
+            with (
+                self.subTest(numpy=np is not None),
+                mock.patch.object(arithmetic_batch, "np", np),
+            ):
+                with self.assertRaisesRegex(ZeroDivisionError, "index 2"):
+                    arithmetic_batch.divide([1, 2, 3, 4], [1, 1, 0, 0])
+
+    def test_divide_nan(self):
+        for np in BACKENDS:
+            with (
+                self.subTest(numpy=np is not None),
+                mock.patch.object(arithmetic_batch, "np", np),
+            ):
+                quotients = arithmetic_batch.divide([1, 0, 3], [0, 0, 3], on_zero="nan")
+                self.assertTrue(math.isnan(quotients[0]))
+                self.assertTrue(math.isnan(quotients[1]))
+                self.assertEqual(quotients[2], 1)
+
+    def test_divide_mask(self):
+        for np in BACKENDS:
+            with (
+                self.subTest(numpy=np is not None),
+                mock.patch.object(arithmetic_batch, "np", np),
+            ):
+                quotients, mask = arithmetic_batch.divide(
+                    [1, 2, 3], [1, 0, 3], on_zero="mask"
+                )
+                self.assertEqual([bool(m) for m in mask], [False, True, False])
+                self.assertEqual(quotients[2], 1)
+                _, mask = arithmetic_batch.divide([1], [2], on_zero="mask")
+                self.assertEqual([bool(m) for m in mask], [False])
+
+    def test_invalid_on_zero(self):
+        with self.assertRaises(ValueError):
+            arithmetic_batch.divide([1], [1], on_zero="ignore")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,177 @@
+"""sketches module. Contains the classes CountMinSketch, HyperLogLog,
+SpaceSaving and WordSketch for counting words approximately with fixed memory.
+"""
+
+import heapq
+import math
+from array import array
+from collections import Counter
+
+MASK64 = (1 << 64) - 1
+
+
+def hash64(word):
+    """Returns a 64-bit hash of word.
+
+    Python randomises the hashes of strings for each process, so the sketches
+    can only be compared within the same process.
+    """
+    return hash(word) & MASK64
+
+
+class CountMinSketch:
+    """Estimates the frequency of words with depth rows of width counters.
+
+    An estimate is never too small and exceeds the true frequency by at most
+    ``epsilon * total`` with a probability of ``1 - delta``.
+    """
+
+    def __init__(self, width=2048, depth=5):
+        self.width = width
+        self.depth = depth
+        self.rows = [array("Q", bytes(8 * width)) for _ in range(depth)]
+        self.count = 0
+
+    @classmethod
+    def from_error(cls, epsilon=0.001, delta=0.01):
+        """Create a sketch with the size required for the error bounds."""
+        return cls(math.ceil(math.e / epsilon), math.ceil(math.log(1 / delta)))
+
+    def _indexes(self, word):
+        # Kirsch-Mitzenmacher: derive depth hash functions from two halves
+        h = hash64(word)
+        h1, h2 = h & 0xFFFFFFFF, h >> 32
+        return [(h1 + i * h2) % self.width for i in range(self.depth)]
+
+    def add(self, word, n=1):
+        for row, index in zip(self.rows, self._indexes(word)):
+            row[index] += n
+        self.count += n
+
+    def update(self, words):
+        # Combine duplicates first so that each word is hashed only once
+        for word, n in Counter(words).items():
+            self.add(word, n)
+
+    def __getitem__(self, word):
+        indexes = self._indexes(word)
+        return min(row[index] for row, index in zip(self.rows, indexes))
+
+
+class HyperLogLog:
+    """Estimates the number of different words with 2**precision registers.
+
+    The standard error is about ``1.04 / sqrt(2**precision)``, i.e. 0.8 % for
+    the default precision of 14, which requires 16 KiB.
+    """
+
+    def __init__(self, precision=14):
+        self.precision = precision
+        self.m = 1 << precision
+        self.registers = bytearray(self.m)
+
+    def add(self, word):
+        h = hash64(word)
+        index = h >> (64 - self.precision)
+        rest = h & ((1 << (64 - self.precision)) - 1)
+        # Position of the first 1 bit in the remaining bits
+        rank = 64 - self.precision - rest.bit_length() + 1
+        if rank > self.registers[index]:
+            self.registers[index] = rank
+
+    def update(self, words):
+        for word in set(words):
+            self.add(word)
+
+    def __len__(self):
+        m = self.m
+        alpha = 0.7213 / (1 + 1.079 / m)
+        estimate = alpha * m * m / sum(2.0**-r for r in self.registers)
+        zeros = self.registers.count(0)
+        if estimate <= 2.5 * m and zeros:
+            # Linear counting is more accurate for small cardinalities
+            estimate = m * math.log(m / zeros)
+        return round(estimate)
+
+
+class SpaceSaving:
+    """Finds the k most frequent words (heavy hitters) with k counters.
+
+    Each word that occurs more than ``total / k`` times is guaranteed to be
+    monitored; its count is overestimated by at most ``errors[word]``.
+    """
+
+    def __init__(self, k=100):
+        self.k = k
+        self.counts = {}
+        self.errors = {}
+        # Contains exactly one entry per monitored word, but its count may be
+        # outdated; outdated entries are corrected when they are popped.
+        self._heap = []
+
+    def _pop_min(self):
+        while True:
+            count, word = heapq.heappop(self._heap)
+            if self.counts[word] == count:
+                return word
+            heapq.heappush(self._heap, (self.counts[word], word))
+
+    def add(self, word, n=1):
+        if word in self.counts:
+            self.counts[word] += n
+        elif len(self.counts) < self.k:
+            self.counts[word] = n
+            self.errors[word] = 0
+            heapq.heappush(self._heap, (n, word))
+        else:
+            # Replace the word with the smallest count
+            evicted = self._pop_min()
+            minimum = self.counts.pop(evicted)
+            del self.errors[evicted]
+            self.counts[word] = minimum + n
+            self.errors[word] = minimum
+            heapq.heappush(self._heap, (minimum + n, word))
+
+    def update(self, words):
+        for word, n in Counter(words).items():
+            self.add(word, n)
+
+    def most_common(self, n=None):
+        return heapq.nlargest(
+            n or len(self.counts), self.counts.items(), key=lambda item: item[1]
+        )
+
+
+class WordSketch:
+    """Approximate replacement for :class:`collections.Counter` with fixed
+    memory.
+
+    Combines a :class:`CountMinSketch` for the frequencies, a
+    :class:`HyperLogLog` for the number of unique words and
+    :class:`SpaceSaving` for the most frequent words.
+    """
+
+    def __init__(self, epsilon=0.001, delta=0.01, precision=14, k=100):
+        self.frequencies = CountMinSketch.from_error(epsilon, delta)
+        self.unique = HyperLogLog(precision)
+        self.heavy_hitters = SpaceSaving(k)
+
+    def update(self, words):
+        occurs = Counter(words)
+        for word, n in occurs.items():
+            self.frequencies.add(word, n)
+            self.unique.add(word)
+            self.heavy_hitters.add(word, n)
+
+    def total(self):
+        return self.frequencies.count
+
+    def __len__(self):
+        return len(self.unique)
+
+    def __getitem__(self, word):
+        return self.frequencies[word]
+
+    def most_common(self, n=None):
+        occurs = [(word, self.frequencies[word]) for word in self.heavy_hitters.counts]
+        return heapq.nlargest(n or len(occurs), occurs, key=lambda item: item[1])
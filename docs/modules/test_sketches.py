@@ -0,0 +1,44 @@
+import unittest
+from collections import Counter
+
+import sketches
+
+
+class TestSketches(unittest.TestCase):
+    def setUp(self):
+        self.words = [f"id{i}" for i in range(5000)] + ["hot"] * 500 + ["warm"] * 200
+        self.occurs = Counter(self.words)
+
+    def test_count_min_sketch(self):
+        sketch = sketches.CountMinSketch.from_error(epsilon=0.01, delta=0.01)
+        sketch.update(self.words)
+        self.assertEqual(sketch.count, len(self.words))
+        for word in ("hot", "warm", "id42"):
+            self.assertGreaterEqual(sketch[word], self.occurs[word])
+            self.assertLessEqual(
+                sketch[word], self.occurs[word] + 0.01 * len(self.words)
+            )
+
+    def test_hyperloglog(self):
+        hll = sketches.HyperLogLog()
+        hll.update(self.words)
+        self.assertAlmostEqual(
+            len(hll), len(self.occurs), delta=0.05 * len(self.occurs)
+        )
+
+    def test_space_saving(self):
+        heavy_hitters = sketches.SpaceSaving(k=20)
+        heavy_hitters.update(self.words)
+        self.assertEqual(len(heavy_hitters.counts), 20)
+        top = [word for word, _ in heavy_hitters.most_common(2)]
+        self.assertEqual(top, ["hot", "warm"])
+
+    def test_word_sketch(self):
+        occurs = sketches.WordSketch(k=20)
+        occurs.update(self.words)
+        self.assertEqual(occurs.total(), len(self.words))
+        self.assertEqual(occurs.most_common(1)[0][0], "hot")
+
+
+if __name__ == "__main__":
+    unittest.main()
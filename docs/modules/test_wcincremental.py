@@ -0,0 +1,71 @@
+import os
+import tempfile
+import unittest
+
+import wcincremental
+
+
+class TestCountNewWords(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.file_name = os.path.join(self.tmpdir.name, "access.log")
+        self.state_file = os.path.join(self.tmpdir.name, "access.wcstate")
+        self.write("GET /index.html\nGET /about.html\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def write(self, text, mode="a"):
+        with open(self.file_name, mode) as f:
+            f.write(text)
+
+    def count(self):
+        return wcincremental.count_new_words(self.file_name, self.state_file)
+
+    def test_append(self):
+        occurs, bytes_read = self.count()
+        self.assertEqual(occurs["GET"], 2)
+        self.assertEqual(bytes_read, os.path.getsize(self.file_name))
+        self.write("POST /login\nGET /index.html\n")
+        occurs, bytes_read = self.count()
+        self.assertEqual(occurs["GET"], 3)
+        self.assertEqual(occurs["/index.html"], 2)
+        self.assertEqual(bytes_read, len("POST /login\nGET /index.html\n"))
+
+    def test_unchanged(self):
+        self.count()
+        occurs, bytes_read = self.count()
+        self.assertEqual(occurs["GET"], 2)
+        self.assertEqual(bytes_read, 0)
+
+    def test_incomplete_line(self):
+        self.write("POST /lo")
+        occurs, _ = self.count()
+        self.assertNotIn("/lo", occurs)
+        self.write("gin\n")
+        occurs, _ = self.count()
+        self.assertEqual(occurs["/login"], 1)
+
+    def test_truncate(self):
+        self.count()
+        self.write("POST /login\n", mode="w")
+        occurs, _ = self.count()
+        self.assertEqual(occurs, {"POST": 1, "/login": 1})
+
+    def test_rewrite(self):
+        self.count()
+        self.write("PUT /about.html\nGET /index.html\nGET /about.html\n", mode="w")
+        occurs, _ = self.count()
+        self.assertEqual(occurs["PUT"], 1)
+        self.assertEqual(occurs["GET"], 2)
+
+    def test_rotate(self):
+        self.count()
+        os.rename(self.file_name, f"{self.file_name}.1")
+        self.write("POST /login\nPOST /login\nPOST /login\n")
+        occurs, _ = self.count()
+        self.assertEqual(occurs, {"POST": 3, "/login": 3})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,108 @@
+import io
+import os
+import tempfile
+import unittest
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+import wcparallel
+
+
+class TestCountFiles(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w", newline="") as f:
+            for i in range(1000):
+                f.write(f"line {i} with some words\r\n" if i % 3 else f"{i}\n")
+            f.write("no newline at the end")
+        self.min_range_size = wcparallel.MIN_RANGE_SIZE
+        wcparallel.MIN_RANGE_SIZE = 100
+
+    def tearDown(self):
+        wcparallel.MIN_RANGE_SIZE = self.min_range_size
+        os.remove(self.filename)
+
+    def count_lines(self, mode):
+        with open(self.filename, mode) as f:
+            return wcparallel.count_stream(f)
+
+    def test_split_ranges(self):
+        ranges = wcparallel.split_ranges(self.filename, 4)
+        self.assertEqual(len(ranges), 4)
+        self.assertEqual(ranges[0][0], 0)
+        self.assertEqual(ranges[-1][1], os.path.getsize(self.filename))
+
+    def test_parallel_counts(self):
+        counts = wcparallel.count_files([self.filename] * 2, jobs=4)
+        self.assertEqual(counts, [self.count_lines("r")] * 2)
+
+    def test_binary_counts(self):
+        counts = wcparallel.count_files([self.filename], jobs=1, binary=True)
+        self.assertEqual(counts[0][2], self.count_lines("rb")[2])
+
+    def test_fast_counts(self):
+        with open(self.filename, "rb") as f:
+            line_count, _, char_count = wcparallel.count_fast(f, "-l")
+        with open(self.filename) as f:
+            self.assertEqual(line_count, len(f.readlines()))
+        with open(self.filename, "rb") as f:
+            line_count, _, char_count = wcparallel.count_fast(f, "-c")
+        self.assertEqual(char_count, os.path.getsize(self.filename))
+
+    def test_fast_counts_pipe(self):
+        read_fd, write_fd = os.pipe()
+        os.close(write_fd)
+        with open(read_fd, "rb") as f:
+            self.assertIsNone(wcparallel.count_fast(f, "-c"))
+
+
+class TestMain(unittest.TestCase):
+    def setUp(self):
+        fd, self.filename = tempfile.mkstemp(suffix=".txt")
+        with os.fdopen(fd, "w", newline="") as f:
+            for i in range(1000):
+                f.write(f"line {i}" + ("\n", "\r\n", "\r")[i % 3])
+            f.write("no line ending")
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def main(self, *args):
+        stdout = io.StringIO()
+        with (
+            mock.patch("sys.argv", ["wcparallel.py", *args]),
+            redirect_stdout(stdout),
+        ):
+            wcparallel.main()
+        return stdout.getvalue()
+
+    def test_lines_with_cr_and_crlf(self):
+        counts = self.main(self.filename)
+        self.assertIn(" has 1001 lines, ", counts)
+        # Small blocks also split \r\n between two blocks
+        for block_size in (7, 8, wcparallel.BLOCK_SIZE):
+            with (
+                self.subTest(block_size=block_size),
+                mock.patch.object(wcparallel, "BLOCK_SIZE", block_size),
+            ):
+                self.assertEqual(
+                    self.main("-l", self.filename),
+                    f"{self.filename} has 1001 lines.\n",
+                )
+
+    def test_invalid_jobs(self):
+        for args in (["-j"], ["-j", "x"], ["-j", "0"]):
+            with self.subTest(args=args):
+                stderr = io.StringIO()
+                with (
+                    mock.patch("sys.argv", ["wcparallel.py", *args]),
+                    redirect_stderr(stderr),
+                    self.assertRaises(SystemExit) as cm,
+                ):
+                    wcparallel.main()
+                self.assertEqual(cm.exception.code, 2)
+                self.assertIn("usage:", stderr.getvalue())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,30 @@
+import io
+import unittest
+
+import wcstream
+
+
+class TestCountWords(unittest.TestCase):
+    def setUp(self):
+        self.text = "Python basics  Jupyter\nTutorial\n\nPython  Tutorial"
+
+    def test_count_words(self):
+        occurs = wcstream.count_words(io.StringIO(self.text))
+        self.assertEqual(occurs["Python"], 2)
+        self.assertEqual(occurs["Tutorial"], 2)
+        self.assertEqual(occurs.total(), 6)
+
+    def test_words_split_across_chunks(self):
+        expected = wcstream.count_words(io.StringIO(self.text))
+        for chunk_size in range(1, len(self.text) + 1):
+            with self.subTest(chunk_size=chunk_size):
+                occurs = wcstream.count_words(io.StringIO(self.text), chunk_size)
+                self.assertEqual(occurs, expected)
+
+    def test_empty_file(self):
+        occurs = wcstream.count_words(io.StringIO(""))
+        self.assertEqual(occurs.total(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,131 @@
+"""wcincremental module. Contains the functions: count_new_words() and
+words_occur()
+
+Counts the words of an append-only file, such as a log file, incrementally: the
+counts and the position up to which the file has been read are saved in a state
+file, so that the next run only has to read the lines that have been appended
+since then.
+"""
+
+import hashlib
+import json
+import locale
+import os
+from argparse import ArgumentParser
+from collections import Counter
+
+# Number of bytes read from the file at once
+BLOCK_SIZE = 1024 * 1024
+# Number of bytes before the saved offset used to recognise the file again
+FINGERPRINT_SIZE = 1024
+
+
+def fingerprint(f, offset):
+    """Returns a hash of the bytes before offset."""
+    start = max(0, offset - FINGERPRINT_SIZE)
+    f.seek(start)
+    return hashlib.sha256(f.read(offset - start)).hexdigest()
+
+
+def load_state(state_file):
+    """Load the saved state or return None if there is none."""
+    try:
+        with open(state_file, encoding="utf-8") as f:
+            return json.load(f)
+    except FileNotFoundError:
+        return None
+
+
+def save_state(state_file, state):
+    """Save the state atomically so that an interrupted run cannot leave a
+    corrupt state file behind."""
+    tmp_file = f"{state_file}.tmp"
+    with open(tmp_file, "w", encoding="utf-8") as f:
+        json.dump(state, f, separators=(",", ":"))
+    os.replace(tmp_file, state_file)
+
+
+def is_continuation(state, status, f):
+    """Check whether the file is still the one described by state and has only
+    been appended to since then."""
+    if state is None:
+        return False
+    if (status.st_dev, status.st_ino) != (state["device"], state["inode"]):
+        # The file has been rotated
+        return False
+    if status.st_size < state["offset"]:
+        # The file has been truncated
+        return False
+    return fingerprint(f, state["offset"]) == state["fingerprint"]
+
+
+def count_new_words(file_name, state_file=None):
+    """count_new_words() - count the occurrences of words in file_name.
+
+    Only the complete lines appended since the last run are read; if the file
+    has been rotated or truncated, it is counted again from the beginning.
+    Returns a :class:`collections.Counter` with the counts for the entire file
+    and the number of bytes read.
+    """
+    state_file = state_file or f"{file_name}.wcstate"
+    state = load_state(state_file)
+    encoding = locale.getpreferredencoding(False)
+    with open(file_name, "rb") as f:
+        status = os.fstat(f.fileno())
+        if not is_continuation(state, status, f):
+            state = {"offset": 0, "counts": {}}
+        elif (status.st_size, status.st_mtime_ns) == (state["size"], state["mtime"]):
+            # The file has not changed since the last run
+            return Counter(state["counts"]), 0
+        occurs = Counter(state["counts"])
+        offset = state["offset"]
+        f.seek(offset)
+        rest = b""
+        while block := f.read(BLOCK_SIZE):
+            # The last line may not yet be completely written, so only complete
+            # lines are counted
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            block, rest = block[:cut], block[cut:]
+            occurs.update(block.decode(encoding).split())
+            offset += len(block)
+        bytes_read = offset - state["offset"]
+        state = {
+            "device": status.st_dev,
+            "inode": status.st_ino,
+            "size": status.st_size,
+            "mtime": status.st_mtime_ns,
+            "offset": offset,
+            "fingerprint": fingerprint(f, offset),
+            "counts": occurs,
+        }
+    save_state(state_file, state)
+    return occurs, bytes_read
+
+
+def words_occur(file_name, state_file=None, top=None):
+    """words_occur() - count the occurrences of words in a file incrementally."""
+    occurs, bytes_read = count_new_words(file_name, state_file)
+    print(
+        f"File {file_name} has {occurs.total()} words, "
+        f"{len(occurs)} are unique ({bytes_read} new bytes read):"
+    )
+    print(dict(occurs.most_common(top)))
+    return occurs
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("filename", help="read data from the file")
+    parser.add_argument(
+        "-s", "--state", dest="state_file", help="save the state in STATE_FILE"
+    )
+    parser.add_argument(
+        "-t", "--top", type=int, help="only print the TOP most frequent words"
+    )
+    args = parser.parse_args()
+    words_occur(args.filename, args.state_file, args.top)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,272 @@
+"""wcparallel module. Contains the functions: count_files(), count_fast() and
+count_stream()
+
+Counts the lines, words and characters of several files or stdin like
+wcargv_stdin.py, but splits large files into byte ranges that are counted in
+several processes.
+"""
+
+import io
+import locale
+import mmap
+import os
+import stat
+import sys
+from argparse import ArgumentParser, ArgumentTypeError
+from concurrent.futures import ProcessPoolExecutor
+
+# Number of bytes a worker reads at once
+BLOCK_SIZE = 16 * 1024 * 1024
+# Files smaller than this are not split into several ranges
+MIN_RANGE_SIZE = 4 * 1024 * 1024
+
+
+def count_text(text):
+    """Count lines, words and characters of a text that ends at a line
+    boundary."""
+    # Translate line endings in the same way as files opened in text mode
+    text = text.replace("\r\n", "\n").replace("\r", "\n")
+    line_count = text.count("\n")
+    if text and not text.endswith("\n"):
+        line_count += 1
+    return line_count, len(text.split()), len(text)
+
+
+def count_bytes(data):
+    """Count lines, words and bytes of data that ends at a line boundary."""
+    line_count = data.count(b"\n")
+    if data and not data.endswith(b"\n"):
+        line_count += 1
+    return line_count, len(data.split()), len(data)
+
+
+def add_counts(*counts):
+    """Add up several (lines, words, characters) tuples."""
+    return tuple(map(sum, zip(*counts)))
+
+
+def count_range(filename, start, end, binary=False):
+    """Count lines, words and characters between the byte offsets start and
+    end, which must both lie on line boundaries.
+
+    If end is None, the file is read to the end.
+    """
+    encoding = locale.getpreferredencoding(False)
+
+    def count_block(block):
+        if binary:
+            return count_bytes(block)
+        return count_text(block.decode(encoding))
+
+    counts = (0, 0, 0)
+    rest = b""
+    with open(filename, "rb") as infile:
+        if start:
+            infile.seek(start)
+        pos = start
+        while end is None or pos < end:
+            if end is None:
+                block = infile.read(BLOCK_SIZE)
+            else:
+                block = infile.read(min(BLOCK_SIZE, end - pos))
+            if not block:
+                break
+            pos += len(block)
+            # Only process complete lines so that no word is cut off
+            block = rest + block
+            cut = block.rfind(b"\n") + 1
+            block, rest = block[:cut], block[cut:]
+            counts = add_counts(counts, count_block(block))
+    return add_counts(counts, count_block(rest))
+
+
+def split_ranges(filename, jobs):
+    """Split a file into at most jobs byte ranges that end at line
+    boundaries."""
+    if not stat.S_ISREG(os.stat(filename).st_mode):
+        # Pipes and devices can only be read from start to end
+        return [(0, None)]
+    size = os.path.getsize(filename)
+    jobs = max(1, min(jobs, size // MIN_RANGE_SIZE))
+    boundaries = [0]
+    with open(filename, "rb") as infile:
+        for i in range(1, jobs):
+            infile.seek(max(size * i // jobs, boundaries[-1]))
+            # Move to the beginning of the next line
+            infile.readline()
+            if boundaries[-1] < infile.tell() < size:
+                boundaries.append(infile.tell())
+    boundaries.append(size)
+    return list(zip(boundaries[:-1], boundaries[1:]))
+
+
+def count_files(filenames, jobs=1, binary=False):
+    """Count lines, words and characters of several files in jobs processes.
+
+    Large files are split into byte ranges so that they can also be counted in
+    parallel. Returns a list with the counts for each file.
+    """
+    tasks = [
+        (index, filename, start, end)
+        for index, filename in enumerate(filenames)
+        for start, end in split_ranges(filename, jobs)
+    ]
+    if jobs > 1:
+        with ProcessPoolExecutor(max_workers=jobs) as executor:
+            futures = [
+                executor.submit(count_range, *task[1:], binary) for task in tasks
+            ]
+            results = [future.result() for future in futures]
+    else:
+        results = [count_range(*task[1:], binary) for task in tasks]
+    counts = [(0, 0, 0)] * len(filenames)
+    for (index, *_), result in zip(tasks, results):
+        counts[index] = add_counts(counts[index], result)
+    return counts
+
+
+def count_newlines(infile, size):
+    """Count the lines of a regular file from its current position with a
+    memory map, without creating an object for each line.
+
+    As in text mode, ``\\r\\n`` and a single ``\\r`` also end a line, and a last
+    line without a line ending is counted as well.
+    """
+    start = infile.tell()
+    if start >= size:
+        return 0
+    line_count = 0
+    with mmap.mmap(infile.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mm.madvise(mmap.MADV_SEQUENTIAL)
+        for pos in range(start, size, BLOCK_SIZE):
+            block = mm[pos : pos + BLOCK_SIZE]
+            line_count += block.count(b"\n") + block.count(b"\r")
+            # \r\n only ends one line, even if \n starts the next block
+            line_count -= block.count(b"\r\n")
+            if (
+                block.endswith(b"\r")
+                and mm[pos + BLOCK_SIZE : pos + BLOCK_SIZE + 1] == b"\n"
+            ):
+                line_count -= 1
+        if mm[size - 1] not in b"\r\n":
+            line_count += 1
+    return line_count
+
+
+def count_fast(infile, option):
+    """Determine only the number of bytes (-c) or lines (-l) of a binary file
+    object.
+
+    The number of bytes is taken directly from the file size. Returns None if
+    infile is not a regular file, for example a pipe.
+    """
+    status = os.fstat(infile.fileno())
+    if not stat.S_ISREG(status.st_mode):
+        return None
+    if option == "-c":
+        return 0, 0, max(status.st_size - infile.tell(), 0)
+    return count_newlines(infile, status.st_size), 0, 0
+
+
+def count_stream(infile):
+    """Count lines, words and characters of a file object line by line."""
+    # initialize counts
+    line_count = 0
+    word_count = 0
+    char_count = 0
+    with infile:
+        for line in infile:
+            line_count += 1
+            char_count += len(line)
+            words = line.split()
+            word_count += len(words)
+    return line_count, word_count, char_count
+
+
+def print_counts(filename, counts, option):
+    line_count, word_count, char_count = counts
+    if option in ("-c", "-m"):
+        print(f"{filename} has {char_count} characters.")
+    elif option == "-w":
+        print(f"{filename} has {word_count} words.")
+    elif option == "-l":
+        print(f"{filename} has {line_count} lines.")
+    else:
+        # print the answers using the format() method
+        print(
+            f"{filename} has {line_count} lines, {word_count} words and {char_count} characters."
+        )
+
+
+def positive_int(value):
+    """Convert the value of -j into a number greater than zero."""
+    try:
+        number = int(value)
+    except ValueError:
+        raise ArgumentTypeError(f"invalid number: {value!r}") from None
+    if number < 1:
+        raise ArgumentTypeError(f"must be at least 1: {number}")
+    return number
+
+
+def main():
+    """Count the occurrences of lines, words and characters in files or
+    stdin."""
+    parser = ArgumentParser()
+    parser.add_argument(
+        "filenames", nargs="*", help="read data from the files instead of stdin"
+    )
+    options = parser.add_mutually_exclusive_group()
+    for option, help in (
+        ("-c", "only count bytes"),
+        ("-m", "only count characters"),
+        ("-w", "only count words"),
+        ("-l", "only count lines"),
+    ):
+        options.add_argument(
+            option, dest="option", action="store_const", const=option, help=help
+        )
+    parser.add_argument(
+        "-j",
+        "--jobs",
+        type=positive_int,
+        default=1,
+        help="count in JOBS processes",
+    )
+    args = parser.parse_args()
+    option = args.option
+    filenames = args.filenames
+    if not filenames:
+        counts = None
+        if option in ("-c", "-l"):
+            counts = count_fast(sys.stdin.buffer, option)
+        if counts is None:
+            if option == "-c":
+                infile = sys.stdin.buffer
+            else:
+                infile = sys.stdin
+            counts = count_stream(infile)
+        print_counts(None, counts, option)
+        return
+    if option in ("-c", "-l"):
+        counts = []
+        for filename in filenames:
+            with open(filename, "rb") as infile:
+                file_counts = count_fast(infile, option)
+                if file_counts is None:
+                    if option == "-l":
+                        # Count the line endings as in text mode
+                        infile = io.TextIOWrapper(infile)
+                    file_counts = count_stream(infile)
+                counts.append(file_counts)
+    else:
+        counts = count_files(filenames, args.jobs)
+    for filename, file_counts in zip(filenames, counts):
+        print_counts(filename, file_counts, option)
+    if len(filenames) > 1:
+        print_counts("total", add_counts(*counts), option)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""wcstream module. Contains the functions: iter_words(), count_words() and
+words_occur()"""
+
+from argparse import ArgumentParser
+from collections import Counter
+
+from sketches import WordSketch
+
+# Number of characters read from the file at once
+CHUNK_SIZE = 1024 * 1024
+
+
+def iter_words(f, chunk_size=CHUNK_SIZE):
+    """iter_words() - yield lists of words read chunk by chunk from a file.
+
+    A word that is cut off at the end of a chunk is carried over and completed
+    with the beginning of the next chunk.
+    """
+    tail = ""
+    while chunk := f.read(chunk_size):
+        chunk = tail + chunk
+        words = chunk.split()
+        # If the chunk does not end with whitespace, the last word may be
+        # continued in the next chunk.
+        if words and not chunk[-1].isspace():
+            tail = words.pop()
+        else:
+            tail = ""
+        yield words
+    if tail:
+        yield [tail]
+
+
+def count_words(f, chunk_size=CHUNK_SIZE, occurs=None):
+    """count_words() - count the occurrences of words in a file object.
+
+    Returns a :class:`collections.Counter` with the words as keys. Instead, any
+    other object with an ``update`` method can be passed as occurs, for example
+    a :class:`sketches.WordSketch`.
+    """
+    if occurs is None:
+        occurs = Counter()
+    for words in iter_words(f, chunk_size):
+        occurs.update(words)
+    return occurs
+
+
+def words_occur(file_name, top=None, approximate=False):
+    """words_occur() - count the occurrences of words in a file.
+
+    If top is given, only the top most frequent words are printed. With
+    approximate, the words are counted in a :class:`sketches.WordSketch` whose
+    memory requirement does not grow with the number of unique words.
+    """
+    if approximate:
+        occurs = WordSketch(k=max(100, 10 * (top or 10)))
+        top = top or 10
+    else:
+        occurs = Counter()
+    with open(file_name, "r") as f:
+        count_words(f, occurs=occurs)
+    print(
+        f"File {file_name} has {occurs.total()} words, "
+        f"{'about ' if approximate else ''}{len(occurs)} are unique:"
+    )
+    if top:
+        print(dict(occurs.most_common(top)))
+    else:
+        print(dict(occurs))
+    return occurs
+
+
+def main():
+    parser = ArgumentParser()
+    parser.add_argument("filename", help="read data from the file")
+    parser.add_argument(
+        "-t", "--top", type=int, help="only print the TOP most frequent words"
+    )
+    parser.add_argument(
+        "-a",
+        "--approximate",
+        action="store_true",
+        help="count approximately with fixed memory",
+    )
+    args = parser.parse_args()
+    words_occur(args.filename, args.top, args.approximate)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,199 @@
+"""circle_array module: contains the classes Circles and CircleView"""
+
+import functools
+import math
+import operator
+import sys
+import time
+from array import array
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _column(name):
+    """Create a property that reads and writes the value of the view in the
+    array name of the collection."""
+
+    def getter(self):
+        return getattr(self._circles, name)[self._index]
+
+    def setter(self, value):
+        getattr(self._circles, name)[self._index] = value
+
+    return property(getter, setter)
+
+
+class CircleView:
+    """CircleView class: behaves like a Circle, but only refers to a circle in a
+    Circles collection."""
+
+    __slots__ = ("_circles", "_index")
+
+    diameter = _column("_diameters")
+    x = _column("_x")
+    y = _column("_y")
+
+    def __init__(self, circles, index):
+        self._circles = circles
+        self._index = index
+
+    @property
+    def pi(self):
+        return self._circles.pi
+
+    def circumference(self):
+        return self.diameter * self.pi
+
+    def area(self):
+        return self.pi * (self.diameter / 2) ** 2
+
+    def move(self, deltaX, deltaY):
+        self.x = self.x + deltaX
+        self.y = self.y + deltaY
+
+    def __repr__(self):
+        return f"CircleView(diameter={self.diameter}, x={self.x}, y={self.y})"
+
+
+class Circles:
+    """Circles class: stores the diameters and positions of many circles in
+    arrays of floating point numbers.
+
+    Unlike a list of Circle instances, each circle only requires 24 bytes, and
+    sums are calculated without calling a method for each circle. If NumPy is
+    installed, it is used for the calculations.
+    """
+
+    pi = 3.14159
+
+    def __init__(self, diameters=(), x=None, y=None):
+        self._diameters = array("d", diameters)
+        count = len(self._diameters)
+        self._x = array("d", x) if x is not None else array("d", bytes(8 * count))
+        self._y = array("d", y) if y is not None else array("d", bytes(8 * count))
+        if not len(self._x) == len(self._y) == count:
+            raise ValueError("diameters, x and y must have the same length")
+
+    @classmethod
+    def from_circles(cls, circles):
+        """Create a collection from objects with diameter and optionally x and
+        y, for example Circle.circles."""
+        circles = list(circles)
+        return cls(
+            (c.diameter for c in circles),
+            (getattr(c, "x", 0) for c in circles),
+            (getattr(c, "y", 0) for c in circles),
+        )
+
+    def add(self, diameter=1, x=0, y=0):
+        """Add a circle and return a view of it."""
+        self._diameters.append(diameter)
+        self._x.append(x)
+        self._y.append(y)
+        return CircleView(self, len(self._diameters) - 1)
+
+    def extend(self, diameters, x=None, y=None):
+        """Add several circles at once."""
+        other = Circles(diameters, x, y)
+        self._diameters.extend(other._diameters)
+        self._x.extend(other._x)
+        self._y.extend(other._y)
+
+    def __len__(self):
+        return len(self._diameters)
+
+    def __getitem__(self, index):
+        if index < 0:
+            index += len(self)
+        if not 0 <= index < len(self):
+            raise IndexError("circle index out of range")
+        return CircleView(self, index)
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield CircleView(self, index)
+
+    def move(self, deltaX, deltaY, indices=None):
+        """Move all circles or the circles at the positions indices; a circle
+        whose index occurs several times is moved several times."""
+        for column, delta in ((self._x, deltaX), (self._y, deltaY)):
+            if np is not None:
+                # The NumPy array shares the memory with the array
+                values = np.frombuffer(column)
+                if indices is None:
+                    values += delta
+                else:
+                    # Unlike values[indices] += delta, add.at moves a circle
+                    # once for each occurrence of its index
+                    np.add.at(values, np.asarray(indices), delta)
+            elif indices is None:
+                column[:] = array(
+                    "d", map(functools.partial(operator.add, delta), column)
+                )
+            else:
+                for index in indices:
+                    column[index] += delta
+
+    @property
+    def nbytes(self):
+        """Memory requirement of the arrays in bytes."""
+        return sum(a.itemsize * len(a) for a in (self._diameters, self._x, self._y))
+
+    def circumference_values(self):
+        """Return the circumferences of all circles."""
+        if np is not None:
+            return np.frombuffer(self._diameters) * self.pi
+        return array("d", map(self.pi.__mul__, self._diameters))
+
+    def area_values(self):
+        """Return the areas of all circles."""
+        if np is not None:
+            return np.frombuffer(self._diameters) ** 2 * (self.pi / 4)
+        squares = map(operator.mul, self._diameters, self._diameters)
+        return array("d", map((self.pi / 4).__mul__, squares))
+
+    def circumferences(self):
+        """Sum all circle circumferences."""
+        if np is not None:
+            return float(np.frombuffer(self._diameters).sum()) * self.pi
+        return math.fsum(self._diameters) * self.pi
+
+    def areas(self):
+        """Sum all circle areas."""
+        if np is not None:
+            diameters = np.frombuffer(self._diameters)
+            return float(diameters @ diameters) * self.pi / 4
+        squares = map(operator.mul, self._diameters, self._diameters)
+        return math.fsum(squares) * self.pi / 4
+
+
+def benchmark(count=1_000_000):
+    """Compare Circle.circumferences with Circles.circumferences."""
+    from form import Circle
+
+    before = len(Circle.circles)
+    start = time.perf_counter()
+    circles = [Circle(i % 100) for i in range(count)]
+    print(f"{'create Circle':24} {time.perf_counter() - start:8.3f} s")
+    size = sum(sys.getsizeof(c) + sys.getsizeof(c.__dict__) for c in circles)
+    print(f"{'':24} {size / count:8.0f} bytes per circle")
+    start = time.perf_counter()
+    Circle.circumferences()
+    print(f"{'Circle.circumferences':24} {time.perf_counter() - start:8.3f} s")
+    del Circle.circles[before:], circles
+
+    start = time.perf_counter()
+    circles = Circles(i % 100 for i in range(count))
+    print(f"{'create Circles':24} {time.perf_counter() - start:8.3f} s")
+    print(f"{'':24} {circles.nbytes / count:8.0f} bytes per circle")
+    start = time.perf_counter()
+    circles.circumferences()
+    print(f"{'Circles.circumferences':24} {time.perf_counter() - start:8.3f} s")
+    print(f"NumPy: {'yes' if np is not None else 'no'}")
+
+
+if __name__ == "__main__":
+    benchmark()
@@ -0,0 +1,117 @@
+"""circle_registry module: contains the classes CircleRegistry and Circle"""
+
+import math
+import weakref
+from contextlib import contextmanager
+
+from form_pr import Form
+
+
+class CircleRegistry:
+    """CircleRegistry class: knows all circles that still exist and the sum of
+    their circumferences.
+
+    The circles are only referenced weakly, so that they can be released as
+    usual. The sum is updated when circles are added, changed or released, so
+    that it does not have to be calculated again for each query.
+    """
+
+    def __init__(self, maxsize=None):
+        self.maxsize = maxsize
+        self._refs = {}
+        self._circumferences = {}
+        self._total = 0.0
+
+    def add(self, circle):
+        key = id(circle)
+        if key in self._refs:
+            return
+        if self.maxsize is not None and len(self._refs) >= self.maxsize:
+            raise RuntimeError(f"registry is full ({self.maxsize} circles)")
+        # The callback is called as soon as the circle is released
+        self._refs[key] = weakref.ref(circle, lambda ref: self._discard(key))
+        self._circumferences[key] = circle.circumference()
+        self._total += self._circumferences[key]
+
+    def update(self, circle):
+        """Take over the changed circumference of a registered circle."""
+        key = id(circle)
+        if key in self._refs:
+            circumference = circle.circumference()
+            self._total += circumference - self._circumferences[key]
+            self._circumferences[key] = circumference
+
+    def discard(self, circle):
+        self._discard(id(circle))
+
+    def _discard(self, key):
+        if self._refs.pop(key, None) is not None:
+            self._total -= self._circumferences.pop(key)
+
+    def __len__(self):
+        return len(self._refs)
+
+    def __contains__(self, circle):
+        return id(circle) in self._refs
+
+    def __iter__(self):
+        for ref in list(self._refs.values()):
+            if (circle := ref()) is not None:
+                yield circle
+
+    @property
+    def total(self):
+        return self._total
+
+    def recalculate(self):
+        """Recalculate the sum to remove the rounding errors that accumulate
+        with many changes."""
+        self._total = math.fsum(self._circumferences.values())
+        return self._total
+
+
+class Circle(Form):
+    """Circle Class: inherits from Form and registers its instances in the
+    CircleRegistry registry"""
+
+    registry = CircleRegistry()
+    pi = 3.14159
+
+    def __init__(self, diameter=1, x=0, y=0):
+        super().__init__(x, y)
+        self.__diameter = diameter
+        self.__registry = self.__class__.registry
+        if self.__registry is not None:
+            self.__registry.add(self)
+
+    @property
+    def diameter(self):
+        return self.__diameter
+
+    @diameter.setter
+    def diameter(self, new_diameter):
+        self.__diameter = new_diameter
+        if self.__registry is not None:
+            self.__registry.update(self)
+
+    def circumference(self):
+        return self.diameter * self.__class__.pi
+
+    @classmethod
+    def circumferences(cls):
+        """Class method that returns the sum of all circle circumferences."""
+        if cls.registry is None:
+            return 0.0
+        return cls.registry.total
+
+    @classmethod
+    @contextmanager
+    def use_registry(cls, registry):
+        """Register the circles created within the with block in registry;
+        with None, they are not registered at all."""
+        previous = cls.registry
+        cls.registry = registry
+        try:
+            yield registry
+        finally:
+            cls.registry = previous
@@ -0,0 +1,51 @@
+"""Compare memory requirement and speed of the variants of the form module"""
+
+import importlib
+import sys
+import timeit
+import tracemalloc
+
+VARIANTS = ["form", "form_pr", "form_slots", "form_frozen"]
+
+
+def bytes_per_instance(cls, count):
+    """Return the memory requirement of an instance of cls in bytes."""
+    circles = getattr(cls, "circles", [])
+    before = sys.getsizeof(circles)
+    tracemalloc.start()
+    shapes = [cls(1.5, 1.0, 1.0) for _ in range(count)]
+    current, _ = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    # The lists themselves are not part of the instances
+    current -= sys.getsizeof(shapes) + sys.getsizeof(circles) - before
+    del circles[-count:]
+    return current / count
+
+
+def rate(statement, shapes):
+    """Return how often statement is executed per second for the shape s."""
+    duration = timeit.timeit(
+        f"for s in shapes: {statement}", number=1, globals=locals()
+    )
+    return len(shapes) / duration
+
+
+def benchmark(count=1_000_000):
+    print(f"{'':12} {'bytes':>8} {'diameter':>12} {'circumference':>14} {'move':>12}")
+    for name in VARIANTS:
+        module = importlib.import_module(name)
+        size = bytes_per_instance(module.Circle, count)
+        circles = [module.Circle(1.5, 1.0, 1.0) for _ in range(count)]
+        read = rate("s.diameter", circles)
+        circumference = rate("s.circumference()", circles)
+        move = rate("s.move(1, 1)", circles)
+        getattr(module.Circle, "circles", []).clear()
+        print(
+            f"{name:12} {size:8.0f} {read:12,.0f} {circumference:14,.0f} "
+            f"{move:12,.0f}"
+        )
+    print("Calls per second; bytes per instance")
+
+
+if __name__ == "__main__":
+    benchmark(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
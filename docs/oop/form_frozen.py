@@ -0,0 +1,44 @@
+"""form_frozen module. Contains the classes Form, Square and Circle; Square and
+Circle are frozen dataclasses"""
+
+from dataclasses import dataclass, replace
+from typing import ClassVar
+
+
+class Form:
+    """Form class: has method move, which returns a moved copy"""
+
+    __slots__ = ()
+
+    def move(self, deltaX, deltaY):
+        return replace(self, x=self.x + deltaX, y=self.y + deltaY)
+
+
+@dataclass(frozen=True, slots=True)
+class Square(Form):
+    """Square Class: inherits from Form"""
+
+    length: float = 1
+    x: float = 0
+    y: float = 0
+
+    def circumference(self):
+        return 4 * self.length
+
+
+@dataclass(frozen=True, slots=True)
+class Circle(Form):
+    """Circle Class: inherits from Form
+
+    Unlike in the form module, the circles are not collected in the class
+    variable circles, as move creates a new circle each time.
+    """
+
+    diameter: float = 1
+    x: float = 0
+    y: float = 0
+
+    pi: ClassVar[float] = 3.14159
+
+    def circumference(self):
+        return self.diameter * self.__class__.pi
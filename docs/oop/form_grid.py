@@ -0,0 +1,207 @@
+"""form_grid module: contains the class Grid, a spatial index for forms"""
+
+import heapq
+import math
+import random
+import time
+
+
+class Grid:
+    """Grid class: divides the plane into square cells and remembers which
+    forms are located in which cell.
+
+    Queries only have to check the cells near a point instead of all forms.
+    Forms that are moved with Grid.move remain in the correct cell; if a form
+    is moved in a different way, Grid.update must be called for it. Frozen
+    forms, whose move method returns a new form, are replaced by the new form.
+    """
+
+    def __init__(self, cell_size=10, forms=()):
+        self.cell_size = cell_size
+        self._cells = {}
+        self._positions = {}
+        # Smallest and largest column and row of the occupied cells, None if
+        # they have to be determined again
+        self._extent = None
+        for form in forms:
+            self.add(form)
+
+    def _cell(self, x, y):
+        return math.floor(x / self.cell_size), math.floor(y / self.cell_size)
+
+    def add(self, form):
+        cell = self._cell(form.x, form.y)
+        # The forms are stored by their id, as forms with the same values
+        # can be equal
+        self._cells.setdefault(cell, {})[id(form)] = form
+        self._positions[id(form)] = cell
+        if self._extent is not None:
+            c0, r0, c1, r1 = self._extent
+            column, row = cell
+            self._extent = (
+                min(c0, column),
+                min(r0, row),
+                max(c1, column),
+                max(r1, row),
+            )
+
+    def remove(self, form):
+        cell = self._positions.pop(id(form))
+        del self._cells[cell][id(form)]
+        if not self._cells[cell]:
+            del self._cells[cell]
+            self._extent = None
+
+    def update(self, form):
+        """Move form to the cell of its current position."""
+        if self._positions[id(form)] != self._cell(form.x, form.y):
+            self.remove(form)
+            self.add(form)
+
+    def move(self, forms, deltaX, deltaY):
+        """Move all forms by deltaX and deltaY and return the moved forms."""
+        moved = []
+        for form in forms:
+            new_form = form.move(deltaX, deltaY)
+            if new_form is None:
+                self.update(form)
+                moved.append(form)
+            else:
+                self.remove(form)
+                self.add(new_form)
+                moved.append(new_form)
+        return moved
+
+    def __len__(self):
+        return len(self._positions)
+
+    def __contains__(self, form):
+        return id(form) in self._positions
+
+    def _forms_in_cells(self, columns, rows):
+        for column in columns:
+            for row in rows:
+                yield from self._cells.get((column, row), {}).values()
+
+    def in_rectangle(self, x0, y0, x1, y1):
+        """Return the forms whose position lies within the rectangle."""
+        (c0, r0), (c1, r1) = self._cell(x0, y0), self._cell(x1, y1)
+        columns, rows = range(c0, c1 + 1), range(r0, r1 + 1)
+        if len(columns) * len(rows) <= len(self._cells):
+            forms = self._forms_in_cells(columns, rows)
+        else:
+            # The rectangle covers more cells than are occupied
+            forms = (
+                form
+                for (column, row), cell in self._cells.items()
+                if column in columns and row in rows
+                for form in cell.values()
+            )
+        return [form for form in forms if x0 <= form.x <= x1 and y0 <= form.y <= y1]
+
+    def within(self, x, y, radius):
+        """Return the forms that are at most radius away from (x, y)."""
+        return [
+            form
+            for form in self.in_rectangle(
+                x - radius, y - radius, x + radius, y + radius
+            )
+            if math.hypot(form.x - x, form.y - y) <= radius
+        ]
+
+    def _ring(self, column, row, distance, extent):
+        """Yield the forms in the cells that are distance cells away from the
+        cell (column, row) and lie within extent."""
+        if distance == 0:
+            yield from self._cells.get((column, row), {}).values()
+            return
+        c0, r0, c1, r1 = extent
+        columns = range(max(column - distance, c0), min(column + distance, c1) + 1)
+        for r in (row - distance, row + distance):
+            if r0 <= r <= r1:
+                for c in columns:
+                    yield from self._cells.get((c, r), {}).values()
+        rows = range(max(row - distance + 1, r0), min(row + distance - 1, r1) + 1)
+        for c in (column - distance, column + distance):
+            if c0 <= c <= c1:
+                for r in rows:
+                    yield from self._cells.get((c, r), {}).values()
+
+    def nearest(self, x, y, k=1):
+        """Return the k forms closest to (x, y), the closest first.
+
+        The cells are searched in rings around the point until no form in a
+        further ring can be closer than the k forms found so far. Only the
+        rings that overlap the occupied cells are searched.
+        """
+        if not self._cells:
+            return []
+        if self._extent is None:
+            columns = [column for column, _ in self._cells]
+            rows = [row for _, row in self._cells]
+            self._extent = min(columns), min(rows), max(columns), max(rows)
+        extent = c0, r0, c1, r1 = self._extent
+        column, row = self._cell(x, y)
+        first = max(0, c0 - column, column - c1, r0 - row, row - r1)
+        last = max(column - c0, c1 - column, row - r0, r1 - row)
+        candidates = []
+        for distance in range(first, last + 1):
+            for form in self._ring(column, row, distance, extent):
+                distance_to_form = math.hypot(form.x - x, form.y - y)
+                candidates.append((distance_to_form, id(form), form))
+            # Forms in the next ring are at least this far away
+            bound = distance * self.cell_size
+            if len(candidates) >= k:
+                nearest = heapq.nsmallest(k, candidates)
+                if nearest[-1][0] <= bound:
+                    break
+        return [form for _, _, form in heapq.nsmallest(k, candidates)]
+
+
+def per_query(function, points):
+    """Return the average duration of function in milliseconds."""
+    start = time.perf_counter()
+    for x, y in points:
+        function(x, y)
+    return (time.perf_counter() - start) / len(points) * 1e3
+
+
+def benchmark(count=100_000, queries=1_000):
+    """Compare the queries of the grid with a search through all forms."""
+    from form import Square
+
+    random.seed(42)
+    forms = [
+        Square(1, random.uniform(0, 1000), random.uniform(0, 1000))
+        for _ in range(count)
+    ]
+    start = time.perf_counter()
+    grid = Grid(10, forms)
+    print(f"{'build grid':20} {time.perf_counter() - start:8.3f} s")
+    points = [
+        (random.uniform(0, 1000), random.uniform(0, 1000)) for _ in range(queries)
+    ]
+
+    def distance(x, y):
+        return lambda form: math.hypot(form.x - x, form.y - y)
+
+    def within_all(x, y):
+        key = distance(x, y)
+        return [form for form in forms if key(form) <= 20]
+
+    functions = {
+        "nearest (all forms)": lambda x, y: min(forms, key=distance(x, y)),
+        "nearest (grid)": grid.nearest,
+        "within (all forms)": within_all,
+        "within (grid)": lambda x, y: grid.within(x, y, 20),
+    }
+    for name, function in functions.items():
+        print(f"{name:20} {per_query(function, points):8.3f} ms")
+
+    start = time.perf_counter()
+    grid.move(forms, 5, 5)
+    print(f"{'move (grid)':20} {time.perf_counter() - start:8.3f} s")
+
+
+if __name__ == "__main__":
+    benchmark()
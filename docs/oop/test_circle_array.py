@@ -0,0 +1,75 @@
+import unittest
+from unittest import mock
+
+import circle_array
+from form import Circle
+
+
+class TestCircles(unittest.TestCase):
+    def setUp(self):
+        self.circles = circle_array.Circles([1, 2, 3], x=[0, 1, 2], y=[5, 5, 5])
+
+    def test_view(self):
+        view = self.circles[1]
+        self.assertEqual((view.diameter, view.x, view.y), (2, 1, 5))
+        self.assertAlmostEqual(view.circumference(), 2 * Circle.pi)
+        self.assertAlmostEqual(view.area(), Circle.pi)
+        self.assertEqual(self.circles[-1].diameter, 3)
+        with self.assertRaises(IndexError):
+            self.circles[3]
+
+    def test_view_writes_through(self):
+        view = self.circles[0]
+        view.diameter = 4
+        view.move(1, -1)
+        self.assertEqual(self.circles._diameters[0], 4)
+        self.assertEqual((self.circles[0].x, self.circles[0].y), (1, 4))
+
+    def test_add_and_extend(self):
+        view = self.circles.add(10, 1, 1)
+        self.circles.extend([20, 30])
+        self.assertEqual(len(self.circles), 6)
+        self.assertEqual(view.diameter, 10)
+        self.assertEqual([c.y for c in self.circles][-2:], [0, 0])
+        with self.assertRaises(ValueError):
+            self.circles.extend([1, 2], x=[1])
+
+    def test_from_circles(self):
+        originals = [Circle(2, 1, 1), Circle(3)]
+        # Circle collects all instances in the class variable circles
+        for circle in originals:
+            Circle.circles.remove(circle)
+        circles = circle_array.Circles.from_circles(originals)
+        self.assertEqual([c.diameter for c in circles], [2, 3])
+        self.assertEqual([c.x for c in circles], [1, 0])
+
+    def test_sums(self):
+        for np in (circle_array.np, None):
+            with self.subTest(numpy=np is not None):
+                with mock.patch.object(circle_array, "np", np):
+                    self.assertAlmostEqual(self.circles.circumferences(), 6 * Circle.pi)
+                    self.assertAlmostEqual(self.circles.areas(), 14 * Circle.pi / 4)
+                    self.assertEqual(
+                        list(self.circles.circumference_values()),
+                        [c.circumference() for c in self.circles],
+                    )
+                    for value, circle in zip(self.circles.area_values(), self.circles):
+                        self.assertAlmostEqual(value, circle.area())
+
+    def test_move(self):
+        for np in (circle_array.np, None):
+            with self.subTest(numpy=np is not None):
+                circles = circle_array.Circles([1, 2, 3])
+                with mock.patch.object(circle_array, "np", np):
+                    circles.move(1, 2)
+                    circles.move(10, 0, indices=[0, 2])
+                    circles.move(0, 0.5, indices=[1, 1])
+                self.assertEqual([c.x for c in circles], [11, 1, 11])
+                self.assertEqual([c.y for c in circles], [2, 3, 2])
+
+    def test_nbytes(self):
+        self.assertEqual(self.circles.nbytes, 3 * 3 * 8)
+
+
+if __name__ == "__main__":
+    unittest.main()
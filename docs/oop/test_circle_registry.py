@@ -0,0 +1,59 @@
+import gc
+import unittest
+
+from circle_registry import Circle, CircleRegistry
+
+
+class TestCircleRegistry(unittest.TestCase):
+    def setUp(self):
+        self.registry = CircleRegistry()
+        self.scope = Circle.use_registry(self.registry)
+        self.scope.__enter__()
+
+    def tearDown(self):
+        self.scope.__exit__(None, None, None)
+
+    def test_circumferences(self):
+        c1 = Circle(1)
+        c2 = Circle(2)
+        self.assertAlmostEqual(Circle.circumferences(), 3 * Circle.pi)
+        c2.diameter = 3
+        self.assertAlmostEqual(Circle.circumferences(), 4 * Circle.pi)
+        self.assertEqual(list(self.registry), [c1, c2])
+
+    def test_released_circles(self):
+        c1 = Circle(1)
+        Circle(2)
+        gc.collect()
+        self.assertEqual(len(self.registry), 1)
+        self.assertIn(c1, self.registry)
+        self.assertAlmostEqual(Circle.circumferences(), Circle.pi)
+
+    def test_maxsize(self):
+        registry = CircleRegistry(maxsize=1)
+        with Circle.use_registry(registry):
+            c1 = Circle(1)
+            with self.assertRaises(RuntimeError):
+                Circle(2)
+            registry.discard(c1)
+            Circle(3)
+
+    def test_without_registry(self):
+        with Circle.use_registry(None):
+            c = Circle(5)
+            c.diameter = 6
+            self.assertEqual(Circle.circumferences(), 0.0)
+        self.assertNotIn(c, self.registry)
+        self.assertIs(Circle.registry, self.registry)
+
+    def test_recalculate(self):
+        c = Circle(0.1)
+        for _ in range(1000):
+            c.diameter += 0.1
+        self.assertAlmostEqual(
+            self.registry.recalculate(), c.circumference(), places=12
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
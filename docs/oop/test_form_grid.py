@@ -0,0 +1,89 @@
+import math
+import random
+import unittest
+from unittest import mock
+
+import form_frozen
+from form import Circle, Square
+from form_grid import Grid
+
+
+class TestGrid(unittest.TestCase):
+    def setUp(self):
+        random.seed(1)
+        self.forms = [
+            Square(1, random.uniform(-100, 100), random.uniform(-100, 100))
+            for _ in range(500)
+        ]
+        self.grid = Grid(7, self.forms)
+
+    def distance(self, form, x, y):
+        return math.hypot(form.x - x, form.y - y)
+
+    def test_nearest(self):
+        for x, y in [(0, 0), (99, -99), (500, 500), (-3.5, 12)]:
+            for k in (1, 5):
+                with self.subTest(x=x, y=y, k=k):
+                    expected = sorted(self.forms, key=lambda f: self.distance(f, x, y))
+                    self.assertEqual(self.grid.nearest(x, y, k), expected[:k])
+
+    def test_nearest_empty_and_small(self):
+        self.assertEqual(Grid().nearest(0, 0), [])
+        square = Square(1, 3, 4)
+        self.assertEqual(Grid(forms=[square]).nearest(100, 100, 3), [square])
+
+    def test_nearest_far_away(self):
+        with mock.patch.object(Grid, "_ring", wraps=self.grid._ring) as ring:
+            self.assertEqual(len(self.grid.nearest(1e6, 1e6, 3)), 3)
+        # Only the rings that overlap the occupied cells are searched
+        self.assertLessEqual(ring.call_count, 2 * 200 // 7 + 2)
+
+    def test_nearest_after_remove(self):
+        for form in self.forms[1:]:
+            self.grid.remove(form)
+        self.assertEqual(self.grid.nearest(-500, 500, 2), [self.forms[0]])
+
+    def test_within(self):
+        found = self.grid.within(10, 10, 25)
+        expected = [f for f in self.forms if self.distance(f, 10, 10) <= 25]
+        self.assertCountEqual(found, expected)
+
+    def test_in_rectangle(self):
+        found = self.grid.in_rectangle(-20, 0, 30, 50)
+        expected = [f for f in self.forms if -20 <= f.x <= 30 and 0 <= f.y <= 50]
+        self.assertCountEqual(found, expected)
+
+    def test_in_rectangle_larger_than_grid(self):
+        self.assertCountEqual(self.grid.in_rectangle(-1e6, -1e6, 1e6, 1e6), self.forms)
+        self.assertEqual(self.grid.in_rectangle(1e5, 1e5, 1e6, 1e6), [])
+
+    def test_move(self):
+        self.grid.move(self.forms[:100], 50, -30)
+        found = self.grid.within(0, 0, 40)
+        expected = [f for f in self.forms if self.distance(f, 0, 0) <= 40]
+        self.assertCountEqual(found, expected)
+
+    def test_move_frozen(self):
+        squares = [form_frozen.Square(1, i, i) for i in range(10)]
+        grid = Grid(7, squares)
+        moved = grid.move(squares[:5], 100, 0)
+        self.assertEqual(moved, [form_frozen.Square(1, i + 100, i) for i in range(5)])
+        self.assertEqual(len(grid), 10)
+        self.assertNotIn(squares[0], grid)
+        self.assertEqual(grid.nearest(100, 0), [moved[0]])
+        self.assertCountEqual(grid.within(0, 0, 20), squares[5:])
+
+    def test_update_and_remove(self):
+        circle = Circle(1, 0, 0)
+        Circle.circles.remove(circle)
+        self.grid.add(circle)
+        circle.move(1000, 1000)
+        self.grid.update(circle)
+        self.assertEqual(self.grid.nearest(1000, 1000), [circle])
+        self.grid.remove(circle)
+        self.assertNotIn(circle, self.grid)
+        self.assertEqual(len(self.grid), len(self.forms))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,51 @@
+import dataclasses
+import unittest
+
+import form
+import form_frozen
+import form_slots
+
+
+class TestFormSlots(unittest.TestCase):
+    def tearDown(self):
+        form_slots.Circle.circles.clear()
+
+    def test_same_results_as_form(self):
+        for cls in ("Square", "Circle"):
+            with self.subTest(cls=cls):
+                expected = getattr(form, cls)(2, 1, 1)
+                shape = getattr(form_slots, cls)(2, 1, 1)
+                shape.move(1, 2)
+                self.assertEqual((shape.x, shape.y), (2, 3))
+                self.assertEqual(shape.circumference(), expected.circumference())
+
+    def test_no_dict(self):
+        circle = form_slots.Circle()
+        self.assertFalse(hasattr(circle, "__dict__"))
+        with self.assertRaises(AttributeError):
+            circle.radius = 1
+
+    def test_circumferences(self):
+        form_slots.Circle(1)
+        form_slots.Circle(2)
+        self.assertAlmostEqual(form_slots.Circle.circumferences(), 9.42477)
+
+
+class TestFormFrozen(unittest.TestCase):
+    def test_move_returns_copy(self):
+        square = form_frozen.Square(2, 1, 1)
+        moved = square.move(1, 2)
+        self.assertEqual((square.x, square.y), (1, 1))
+        self.assertEqual(moved, form_frozen.Square(2, 2, 3))
+        self.assertEqual(moved.circumference(), 8)
+
+    def test_frozen(self):
+        circle = form_frozen.Circle(2)
+        self.assertAlmostEqual(circle.circumference(), 6.28318)
+        self.assertFalse(hasattr(circle, "__dict__"))
+        with self.assertRaises(dataclasses.FrozenInstanceError):
+            circle.diameter = 3
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,98 @@
+"""
+dataprep.cache
+~~~~~~~~~~~~~~
+
+This module implements a columnar on-disk cache for the dataprep loaders.
+
+Parsed files are saved as uncompressed `Feather
+<https://arrow.apache.org/docs/python/feather.html>`_ files, which are read
+with a memory map. The cache key contains the path, size and modification time
+of the source file and the parse options, so that a changed file or changed
+options automatically lead to a new entry. The least recently used entries are
+deleted as soon as the cache directory exceeds its maximum size.
+"""
+
+import hashlib
+import os
+from pathlib import Path
+
+CACHE_DIR = Path(
+    os.environ.get("DATAPREP_CACHE_DIR", Path.home() / ".cache" / "dataprep")
+)
+MAX_SIZE = 1024**3
+
+
+def cache_key(filename, **options):
+    """Returns the cache key for a file and its parse options.
+
+    :param filename: Path of the source file.
+    :param options: Options with which the file is parsed.
+    :return: :class:`str` object
+    """
+    status = os.stat(filename)
+    key = (
+        os.path.abspath(filename),
+        status.st_size,
+        status.st_mtime_ns,
+        sorted(options.items()),
+    )
+    return hashlib.sha256(repr(key).encode()).hexdigest()
+
+
+def load(key, cache_dir=CACHE_DIR):
+    """Loads a cached DataFrame.
+
+    :param key: Cache key from :func:`cache_key`.
+    :param cache_dir: Directory of the cache.
+    :return: :class:`pandas.DataFrame` object or ``None`` if there is no entry
+    """
+    from pyarrow import feather
+
+    path = Path(cache_dir) / f"{key}.feather"
+    try:
+        df = feather.read_feather(path, memory_map=True)
+    except FileNotFoundError:
+        return None
+    # The modification time marks the last use for the LRU eviction
+    path.touch()
+    return df
+
+
+def store(key, df, cache_dir=CACHE_DIR, max_size=MAX_SIZE):
+    """Saves a DataFrame in the cache and evicts old entries if necessary.
+
+    :param key: Cache key from :func:`cache_key`.
+    :param df: :class:`pandas.DataFrame` to be saved.
+    :param cache_dir: Directory of the cache.
+    :param max_size: Maximum size of the cache directory in bytes.
+    """
+    from pyarrow import feather
+
+    cache_dir = Path(cache_dir)
+    cache_dir.mkdir(parents=True, exist_ok=True)
+    path = cache_dir / f"{key}.feather"
+    tmp_path = path.with_suffix(".tmp")
+    feather.write_feather(df, tmp_path, compression="uncompressed")
+    os.replace(tmp_path, path)
+    evict(cache_dir, max_size)
+
+
+def evict(cache_dir=CACHE_DIR, max_size=MAX_SIZE):
+    """Deletes the least recently used entries until the cache directory is no
+    larger than max_size.
+
+    :param cache_dir: Directory of the cache.
+    :param max_size: Maximum size of the cache directory in bytes.
+    """
+    entries = []
+    for path in Path(cache_dir).glob("*.feather"):
+        status = path.stat()
+        entries.append((status.st_mtime_ns, status.st_size, path))
+    entries.sort()
+    total = sum(size for _, size, _ in entries)
+    # The most recently used entry is always kept
+    for _, size, path in entries[:-1]:
+        if total <= max_size:
+            break
+        path.unlink(missing_ok=True)
+        total -= size
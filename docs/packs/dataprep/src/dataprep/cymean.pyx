@@ -1,3 +1,109 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, cdivision=True
+"""
+dataprep.cymean
+~~~~~~~~~~~~~~~
+
+Typed Cython kernels for descriptive statistics.
+"""
+
+from array import array
+from collections import namedtuple
+
+from libc.math cimport fabs
+
+# Without module, the class would be attributed to importlib and could not be
+# pickled, for example to return it from worker processes
+Stats = namedtuple(
+    "Stats", ["count", "mean", "variance", "min", "max"], module="dataprep.cymean"
+)
+
+
+cdef inline void _add(double value, double *total, double *compensation) noexcept nogil:
+    """Adds value to total using Neumaier's improved Kahan summation."""
+    cdef double t = total[0] + value
+    if fabs(total[0]) >= fabs(value):
+        compensation[0] += (total[0] - t) + value
+    else:
+        compensation[0] += (value - t) + total[0]
+    total[0] = t
+
+
+cdef const double[:] _as_doubles(values):
+    """Returns a view on values without copying if they support the buffer
+    protocol with doubles, otherwise a copy as :class:`array.array`."""
+    cdef const double[:] view
+    try:
+        view = values
+    except (TypeError, ValueError):
+        view = array("d", values)
+    return view
+
+
+def describe(values):
+    """Calculates count, mean, variance, min and max in a single pass.
+
+    :param values: :class:`array.array` of type ``d``, NumPy ``float64`` array,
+        :class:`memoryview` or any other buffer of doubles, which is used
+        without copying; other sequences of numbers are converted first.
+    :return: :class:`Stats` with the population variance
+    :rtype: Stats
+    :raises ZeroDivisionError: if values is empty
+    """
+    cdef const double[:] view = _as_doubles(values)
+    cdef Py_ssize_t i, n = view.shape[0]
+    cdef double x, d, shift, low, high
+    cdef double s1 = 0.0, c1 = 0.0, s2 = 0.0, c2 = 0.0
+
+    if n == 0:
+        raise ZeroDivisionError("describe() requires at least one value")
+
+    with nogil:
+        # Summing the deviations from the first value instead of the values
+        # themselves avoids catastrophic cancellation in the variance.
+        shift = low = high = view[0]
+        for i in range(n):
+            x = view[i]
+            d = x - shift
+            _add(d, &s1, &c1)
+            _add(d * d, &s2, &c2)
+            if x < low:
+                low = x
+            elif x > high:
+                high = x
+
+    s1 += c1
+    s2 += c2
+    variance = (s2 - s1 * s1 / n) / n
+    return Stats(n, shift + s1 / n, max(variance, 0.0), low, high)
+
+
+def combine(a, b):
+    """Combines the statistics of two disjoint sets of values.
+
+    Uses the numerically stable pairwise formula of Chan et al., so that
+    partial results from several workers can be merged in any order.
+
+    :param a: :class:`Stats` of the first set
+    :param b: :class:`Stats` of the second set
+    :return: :class:`Stats` of both sets
+    :rtype: Stats
+    """
+    n = a.count + b.count
+    delta = b.mean - a.mean
+    m2 = (
+        a.variance * a.count
+        + b.variance * b.count
+        + delta * delta * a.count * b.count / n
+    )
+    return Stats(
+        n,
+        a.mean + delta * b.count / n,
+        m2 / n,
+        min(a.min, b.min),
+        max(a.max, b.max),
+    )
+
+
 def mean(nums):
     """Calculates the mean value with Cython"""
-    return sum(nums) / len(nums)
+    return describe(nums).mean
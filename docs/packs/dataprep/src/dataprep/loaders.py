@@ -1,7 +1,146 @@
+import glob
+import os
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, reduce
+
 import pandas as pd
+from dataprep import cache as _cache
+from dataprep.cymean import combine, describe
+
+
+def categorize(df, max_ratio=0.5):
+    """Converts string columns with few distinct values into categories.
+
+    :param df: :class:`pandas.DataFrame` whose columns are converted in place.
+    :param max_ratio: Maximum ratio of distinct values to rows up to which a
+        column is converted.
+    :return: :class:`pandas.DataFrame` object
+    """
+    for column in df.select_dtypes(include=["object", "string"]).columns:
+        if df[column].nunique() <= max_ratio * len(df):
+            df[column] = df[column].astype("category")
+    return df
+
+
+def _iter_csv(filename, **kwargs):
+    with pd.read_csv(filename, **kwargs) as reader:
+        yield from reader
+
 
+def load_csv(
+    filename,
+    columns=None,
+    dtype=None,
+    categories=None,
+    chunksize=None,
+    engine=None,
+    cache=None,
+    **kwargs,
+):
+    """Loads a CSV file.
 
-def load_csv(filename):
-    """Documentation"""
-    df = pd.read_csv(filename)
+    :param filename: Path or file-like object of the CSV file.
+    :param columns: Only load these columns; the same as ``usecols``.
+    :param dtype: Type or :class:`dict` of types per column, for example
+        ``{"language": "category"}``, so that pandas does not have to infer the
+        types.
+    :param categories: Maximum ratio of distinct values to rows up to which
+        string columns are converted to categories; no conversion if ``None``.
+        Not used together with chunksize.
+    :param chunksize: If given, a generator is returned that yields
+        :class:`pandas.DataFrame` objects with at most chunksize rows, so that
+        files larger than the memory can be processed. Categorical columns
+        must then be given in dtype as :class:`pandas.CategoricalDtype` with
+        all categories, so that all chunks have the same types.
+    :param engine: Parser engine, for example ``"pyarrow"``.
+    :param cache: If ``True`` or a directory, the parsed DataFrame is cached as
+        Feather file in :data:`dataprep.cache.CACHE_DIR` or the directory and
+        loaded from there as long as the file and the options do not change.
+        Requires ``pyarrow``; not used together with chunksize or for
+        file-like objects.
+    :param kwargs: Further arguments for :func:`pandas.read_csv`.
+    :return: :class:`pandas.DataFrame` object or generator
+    """
+    if chunksize and engine == "pyarrow":
+        raise ValueError("The pyarrow engine does not support chunksize")
+    if chunksize and categories:
+        # Each chunk would get its own categorical columns and categories
+        raise ValueError(
+            "categories cannot be used with chunksize, "
+            "pass pandas.CategoricalDtype objects as dtype instead"
+        )
+    if columns is not None:
+        if "usecols" in kwargs:
+            raise TypeError("load_csv() got both columns and usecols")
+        kwargs["usecols"] = columns
+    if dtype is not None:
+        kwargs["dtype"] = dtype
+    if engine:
+        kwargs["engine"] = engine
+    if chunksize:
+        return _iter_csv(filename, chunksize=chunksize, **kwargs)
+    if not isinstance(filename, (str, os.PathLike)):
+        # Only files with a path have a size and modification time for the key
+        cache = None
+    if cache:
+        cache_dir = _cache.CACHE_DIR if cache is True else cache
+        key = _cache.cache_key(filename, categories=categories, **kwargs)
+        df = _cache.load(key, cache_dir)
+        if df is not None:
+            return df
+    df = pd.read_csv(filename, **kwargs)
+    if categories:
+        categorize(df, categories)
+    if cache:
+        _cache.store(key, df, cache_dir)
     return df
+
+
+def describe_csv(filename, columns, **kwargs):
+    """Loads a CSV file and describes its numeric columns.
+
+    :param filename: Path of the CSV file.
+    :param columns: Names of the numeric columns.
+    :param kwargs: Further arguments for :func:`load_csv`.
+    :return: :class:`dict` with a :class:`dataprep.cymean.Stats` object per
+        column that contains values
+    """
+    df = load_csv(filename, columns=columns, **kwargs)
+    stats = {}
+    for column in columns:
+        values = df[column].dropna().to_numpy(dtype="float64")
+        if len(values):
+            stats[column] = describe(values)
+    return stats
+
+
+def load_many(pattern, columns, workers=None, processes=False, **kwargs):
+    """Describes the numeric columns of many CSV files concurrently.
+
+    Each file is loaded and described in a worker; only the partial statistics
+    are combined, so the files are never concatenated into one DataFrame.
+
+    :param pattern: :mod:`glob` pattern of the CSV files, for example
+        ``"shards/**/*.csv"``.
+    :param columns: Names of the numeric columns.
+    :param workers: Maximum number of threads or processes.
+    :param processes: Use processes instead of threads. Threads are usually
+        sufficient because the parser and :func:`dataprep.cymean.describe`
+        release the GIL.
+    :param kwargs: Further arguments for :func:`load_csv`.
+    :return: :class:`dict` with a :class:`dataprep.cymean.Stats` object per
+        column
+    """
+    filenames = sorted(glob.glob(pattern, recursive=True))
+    executor_class = ProcessPoolExecutor if processes else ThreadPoolExecutor
+    partials = {column: [] for column in columns}
+    with executor_class(max_workers=workers) as executor:
+        worker = partial(describe_csv, columns=columns, **kwargs)
+        for stats in executor.map(worker, filenames):
+            for column, column_stats in stats.items():
+                partials[column].append(column_stats)
+    return {
+        column: reduce(combine, column_stats)
+        for column, column_stats in partials.items()
+        if column_stats
+    }
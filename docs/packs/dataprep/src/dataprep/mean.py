@@ -6,29 +6,137 @@ This module implements dataprep mean.
 """
 
 import sys
+from argparse import ArgumentParser
+from array import array
+from contextlib import nullcontext
 
-from dataprep.cymean import mean
+from dataprep.cymean import combine, describe, mean
+
+# Number of bytes read from a file at once
+BATCH_SIZE = 8 * 1024 * 1024
+
+
+def parse_lines(lines):
+    """Converts lines with one number each into an array.
+
+    :param lines: Lines to be converted; empty lines are skipped.
+    :return: :class:`array.array` of type ``d`` and number of malformed lines
+    :rtype: tuple
+    """
+    try:
+        return array("d", map(float, lines)), 0
+    except ValueError:
+        # Only parse line by line if the batch contains empty or bad lines
+        values = array("d")
+        malformed = 0
+        for line in lines:
+            if not line.strip():
+                continue
+            try:
+                values.append(float(line))
+            except ValueError:
+                malformed += 1
+        return values, malformed
+
+
+def stream_text(f, batch_size=BATCH_SIZE):
+    """Describes the numbers of a text file with one number per line.
+
+    The file is read in batches of about batch_size bytes, whose statistics
+    are combined, so that the memory requirement does not depend on the size
+    of the file.
+
+    :param f: File object opened in text mode.
+    :param batch_size: Number of bytes read at once.
+    :return: :class:`dataprep.cymean.Stats` or ``None`` if there are no
+        numbers, and the number of malformed lines
+    :rtype: tuple
+    """
+    stats = None
+    malformed = 0
+    while lines := f.readlines(batch_size):
+        values, bad_lines = parse_lines(lines)
+        malformed += bad_lines
+        if values:
+            batch_stats = describe(values)
+            stats = combine(stats, batch_stats) if stats else batch_stats
+    return stats, malformed
+
+
+def stream_binary(f, batch_size=BATCH_SIZE):
+    """Describes a binary file of doubles in native byte order.
+
+    :param f: File object opened in binary mode.
+    :param batch_size: Number of bytes read at once; a multiple of 8.
+    :return: :class:`dataprep.cymean.Stats` or ``None`` if there are no
+        numbers, and the number of bytes of an incomplete value at the end
+    :rtype: tuple
+    """
+    stats = None
+    rest = b""
+    while data := f.read(batch_size):
+        data = rest + data
+        usable = len(data) - len(data) % 8
+        rest = data[usable:]
+        if usable:
+            # The buffer is described without copying it into a list
+            batch_stats = describe(memoryview(data)[:usable].cast("d"))
+            stats = combine(stats, batch_stats) if stats else batch_stats
+    return stats, len(rest)
 
 
 def main():
     """Calculates the mean value.
 
+    The numbers are taken from the command line or, with ``--file``, from a
+    file or stdin (``-``), which is read as a stream.
+
     :param numbers: Numbers from which the mean value is to be calculated.
     :return: :class:`float <float>` object
     :rtype: float
     """
+    parser = ArgumentParser(description="Calculates the mean value.")
+    parser.add_argument("numbers", nargs="*", help="numbers")
+    parser.add_argument(
+        "-f", "--file", help="read one number per line from FILE, - for stdin"
+    )
+    parser.add_argument(
+        "-b",
+        "--binary",
+        action="store_true",
+        help="FILE contains doubles in native byte order",
+    )
+    args = parser.parse_args()
 
     result = 0.0
 
-    try:
-        nums = [float(num) for num in sys.argv[1:]]
-    except ValueError:
-        nums = []
+    if args.file:
+        if args.file == "-":
+            # stdin is not closed after reading
+            infile = nullcontext(sys.stdin.buffer if args.binary else sys.stdin)
+        else:
+            infile = open(args.file, "rb" if args.binary else "r")
+        with infile as f:
+            if args.binary:
+                stats, rest = stream_binary(f)
+            else:
+                stats, malformed = stream_text(f)
+        if stats:
+            result = stats.mean
+        if args.binary and rest:
+            print(f"{rest} bytes of an incomplete value skipped", file=sys.stderr)
+        elif not args.binary and malformed:
+            print(f"{malformed} malformed lines skipped", file=sys.stderr)
+    else:
+        try:
+            nums = [float(num) for num in args.numbers]
+        except ValueError:
+            nums = []
 
-    try:
-        result = mean(nums)
-    except ZeroDivisionError:
-        pass
+        try:
+            result = mean(nums)
+        except ZeroDivisionError:
+            pass
 
     print(result)
 
@@ -0,0 +1,141 @@
+import os
+import tempfile
+import unittest
+from pathlib import Path
+
+from dataprep import cache
+from dataprep.loaders import load_csv
+
+try:
+    import pyarrow
+except ImportError:
+    pyarrow = None
+
+
+class TestCacheKey(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.filename = os.path.join(self.tmpdir.name, "numbers.csv")
+        with open(self.filename, "w") as f:
+            f.write("a,b\n1,2\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def test_same(self):
+        self.assertEqual(
+            cache.cache_key(self.filename, sep=","),
+            cache.cache_key(self.filename, sep=","),
+        )
+
+    def test_options(self):
+        self.assertNotEqual(
+            cache.cache_key(self.filename, sep=","),
+            cache.cache_key(self.filename, sep=";"),
+        )
+        self.assertNotEqual(
+            cache.cache_key(self.filename, sep=","),
+            cache.cache_key(self.filename, sep=",", usecols=["a"]),
+        )
+
+    def test_option_order(self):
+        self.assertEqual(
+            cache.cache_key(self.filename, sep=",", header=None),
+            cache.cache_key(self.filename, header=None, sep=","),
+        )
+
+    def test_modification_time(self):
+        key = cache.cache_key(self.filename)
+        status = os.stat(self.filename)
+        os.utime(self.filename, ns=(status.st_atime_ns, status.st_mtime_ns + 10**9))
+        self.assertNotEqual(cache.cache_key(self.filename), key)
+
+    def test_size(self):
+        key = cache.cache_key(self.filename)
+        with open(self.filename, "a") as f:
+            f.write("3,4\n")
+        self.assertNotEqual(cache.cache_key(self.filename), key)
+
+
+class TestEvict(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmpdir.name)
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def entry(self, key, size, mtime):
+        path = self.cache_dir / f"{key}.feather"
+        path.write_bytes(bytes(size))
+        os.utime(path, ns=(mtime, mtime))
+        return path
+
+    def keys(self):
+        return sorted(path.stem for path in self.cache_dir.glob("*.feather"))
+
+    def test_least_recently_used(self):
+        self.entry("a", 100, 3 * 10**9)
+        self.entry("b", 100, 1 * 10**9)
+        self.entry("c", 100, 2 * 10**9)
+        cache.evict(self.cache_dir, max_size=200)
+        self.assertEqual(self.keys(), ["a", "c"])
+        cache.evict(self.cache_dir, max_size=100)
+        self.assertEqual(self.keys(), ["a"])
+
+    def test_below_max_size(self):
+        self.entry("a", 100, 1 * 10**9)
+        self.entry("b", 100, 2 * 10**9)
+        cache.evict(self.cache_dir, max_size=200)
+        self.assertEqual(self.keys(), ["a", "b"])
+
+    def test_keep_most_recent(self):
+        self.entry("a", 100, 1 * 10**9)
+        self.entry("b", 300, 2 * 10**9)
+        cache.evict(self.cache_dir, max_size=200)
+        self.assertEqual(self.keys(), ["b"])
+
+
+@unittest.skipIf(pyarrow is None, "requires pyarrow")
+class TestLoadCsv(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.cache_dir = Path(self.tmpdir.name) / "cache"
+        self.filename = os.path.join(self.tmpdir.name, "numbers.csv")
+        with open(self.filename, "w") as f:
+            f.write("a,b\n1,2\n3,4\n")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def load(self, **kwargs):
+        return load_csv(self.filename, cache=self.cache_dir, **kwargs)
+
+    def test_cached(self):
+        df = self.load()
+        self.assertEqual(len(list(self.cache_dir.glob("*.feather"))), 1)
+        self.assertTrue(self.load().equals(df))
+        self.assertEqual(len(list(self.cache_dir.glob("*.feather"))), 1)
+
+    def test_changed_file(self):
+        self.load()
+        with open(self.filename, "a") as f:
+            f.write("5,6\n")
+        self.assertEqual(self.load()["a"].tolist(), [1, 3, 5])
+        self.assertEqual(len(list(self.cache_dir.glob("*.feather"))), 2)
+
+    def test_file_object(self):
+        with open(self.filename) as f:
+            df = load_csv(f, cache=self.cache_dir)
+        self.assertEqual(df["a"].tolist(), [1, 3])
+        self.assertFalse(self.cache_dir.exists())
+
+    def test_changed_options(self):
+        self.load()
+        df = self.load(columns=["b"])
+        self.assertEqual(list(df.columns), ["b"])
+        self.assertEqual(len(list(self.cache_dir.glob("*.feather"))), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,110 @@
+import pickle
+import statistics
+import tracemalloc
+import unittest
+from array import array
+
+from dataprep.cymean import Stats, combine, describe, mean
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+class TestDescribe(unittest.TestCase):
+    def assertStats(self, stats, values):
+        self.assertEqual(stats.count, len(values))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(values))
+        self.assertAlmostEqual(stats.variance, statistics.pvariance(values))
+        self.assertEqual(stats.min, min(values))
+        self.assertEqual(stats.max, max(values))
+
+    def test_list(self):
+        values = [3.0, 1.0, 4.0, 1.0, 5.0, 9.0, 2.0, 6.0]
+        self.assertStats(describe(values), values)
+
+    def test_integers(self):
+        values = [3, 1, 4, 1, 5, 9, 2, 6]
+        self.assertStats(describe(values), values)
+        self.assertStats(describe(array("i", values)), values)
+
+    def test_single_value(self):
+        self.assertEqual(describe([2.5]), Stats(1, 2.5, 0.0, 2.5, 2.5))
+
+    def test_empty(self):
+        with self.assertRaises(ZeroDivisionError):
+            describe([])
+        with self.assertRaises(ZeroDivisionError):
+            describe(array("d"))
+
+    def test_buffers(self):
+        values = array("d", [3.0, 1.0, 4.0, 1.0, 5.0])
+        self.assertStats(describe(values), values)
+        self.assertStats(describe(memoryview(values)), values)
+        read_only = memoryview(values.tobytes()).cast("d")
+        self.assertStats(describe(read_only), values)
+
+    def test_buffer_is_not_copied(self):
+        values = array("d", range(1_000_000))
+        tracemalloc.start()
+        try:
+            describe(values)
+            describe(memoryview(values))
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        self.assertLess(peak, values.itemsize * len(values) // 10)
+
+    def test_strided(self):
+        values = array("d", range(10))
+        self.assertStats(describe(memoryview(values)[::3]), values[::3])
+
+    @unittest.skipIf(np is None, "requires NumPy")
+    def test_numpy(self):
+        values = np.arange(10, dtype="float64")
+        self.assertStats(describe(values), values.tolist())
+        self.assertStats(describe(values[1::2]), values[1::2].tolist())
+        self.assertStats(describe(values.astype("int64")), values.tolist())
+
+    def test_large_offset(self):
+        values = [1e9 + k for k in (4, 7, 13, 16)]
+        stats = describe(values)
+        self.assertEqual(stats.mean, 1e9 + 10)
+        self.assertEqual(stats.variance, 22.5)
+        values = [1e9 + k % 10 for k in range(100_000)]
+        self.assertStats(describe(values), values)
+
+
+class TestCombine(unittest.TestCase):
+    def test_combine(self):
+        a = [1e9 + k for k in range(0, 1000, 3)]
+        b = [1e9 + k for k in range(1, 500, 7)]
+        stats = combine(describe(a), describe(b))
+        expected = describe(a + b)
+        self.assertEqual(stats.count, expected.count)
+        self.assertAlmostEqual(stats.mean, expected.mean)
+        self.assertAlmostEqual(stats.variance, expected.variance, places=6)
+        self.assertEqual(stats.min, expected.min)
+        self.assertEqual(stats.max, expected.max)
+
+    def test_pickle(self):
+        stats = describe([1.0, 2.0])
+        self.assertEqual(pickle.loads(pickle.dumps(stats)), stats)
+
+    def test_order(self):
+        a, b = describe([1.0, 2.0, 3.0]), describe([10.0, 20.0])
+        self.assertEqual(combine(a, b), combine(b, a))
+
+
+class TestMean(unittest.TestCase):
+    def test_mean(self):
+        self.assertEqual(mean([1, 2, 3, 4]), 2.5)
+
+    def test_empty(self):
+        with self.assertRaises(ZeroDivisionError):
+            mean([])
+
+
+if __name__ == "__main__":
+    unittest.main()
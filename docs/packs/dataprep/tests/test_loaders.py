@@ -0,0 +1,112 @@
+import io
+import os
+import tempfile
+import unittest
+
+import pandas as pd
+from dataprep.loaders import categorize, load_csv, load_many
+
+BOOKS = """\
+Python basics,en,Veit Schiele,BSD-3-Clause,2021-10-28
+Jupyter Tutorial,en,Veit Schiele,BSD-3-Clause,2019-06-27
+Jupyter Tutorial,de,Veit Schiele,BSD-3-Clause,2020-10-26
+PyViz Tutorial,en,Veit Schiele,BSD-3-Clause,2020-04-13
+"""
+NAMES = ["title", "language", "author", "license", "release_date"]
+
+
+class TestLoadCsv(unittest.TestCase):
+    def load(self, **kwargs):
+        return load_csv(io.StringIO(BOOKS), header=None, names=NAMES, **kwargs)
+
+    def test_columns(self):
+        df = self.load(columns=["title", "language"])
+        self.assertEqual(list(df.columns), ["title", "language"])
+        self.assertEqual(len(df), 4)
+
+    def test_usecols(self):
+        df = self.load(usecols=["title"])
+        self.assertEqual(list(df.columns), ["title"])
+        with self.assertRaises(TypeError):
+            self.load(columns=["title"], usecols=["language"])
+
+    def test_categories(self):
+        df = self.load(categories=0.5)
+        self.assertIsInstance(df["language"].dtype, pd.CategoricalDtype)
+        self.assertIsInstance(df["author"].dtype, pd.CategoricalDtype)
+        self.assertNotIsInstance(df["title"].dtype, pd.CategoricalDtype)
+
+    def test_categorize(self):
+        df = pd.DataFrame({"a": ["x", "y", "x", "x"], "b": ["x", "y", "z", "x"]})
+        categorize(df, 0.5)
+        self.assertEqual(list(df["a"].cat.categories), ["x", "y"])
+        self.assertNotIsInstance(df["b"].dtype, pd.CategoricalDtype)
+
+    def test_chunks(self):
+        language = pd.CategoricalDtype(["de", "en"])
+        chunks = list(self.load(dtype={"language": language}, chunksize=3))
+        self.assertEqual([len(chunk) for chunk in chunks], [3, 1])
+        for chunk in chunks:
+            self.assertEqual(chunk["language"].dtype, language)
+        df = pd.concat(chunks)
+        self.assertEqual(df["language"].dtype, language)
+        self.assertEqual(df["language"].tolist(), ["en", "en", "de", "en"])
+
+    def test_chunks_with_categories(self):
+        with self.assertRaises(ValueError):
+            self.load(categories=0.5, chunksize=2)
+
+    def test_chunks_with_pyarrow(self):
+        with self.assertRaises(ValueError):
+            self.load(engine="pyarrow", chunksize=2)
+
+
+class TestLoadMany(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.frames = []
+        for day in range(6):
+            directory = os.path.join(self.tmpdir.name, f"2024-01-{day + 1:02}")
+            os.mkdir(directory)
+            df = pd.DataFrame(
+                {
+                    "price": [1e6 + (day * 7 + i) % 13 for i in range(50)],
+                    "amount": [day + i for i in range(50)],
+                    "shop": ["a", "b"] * 25,
+                }
+            )
+            # Missing values are ignored
+            df.loc[day, "price"] = None
+            df.to_csv(os.path.join(directory, "sales.csv"), index=False)
+            self.frames.append(df)
+        self.pattern = os.path.join(self.tmpdir.name, "**", "*.csv")
+
+    def tearDown(self):
+        self.tmpdir.cleanup()
+
+    def assertMatchesPandas(self, stats):
+        df = pd.concat(self.frames)
+        self.assertEqual(set(stats), {"price", "amount"})
+        for column, column_stats in stats.items():
+            values = df[column].dropna()
+            self.assertEqual(column_stats.count, len(values))
+            self.assertAlmostEqual(column_stats.mean, values.mean())
+            self.assertAlmostEqual(column_stats.variance, values.var(ddof=0))
+            self.assertEqual(column_stats.min, values.min())
+            self.assertEqual(column_stats.max, values.max())
+
+    def test_threads(self):
+        stats = load_many(self.pattern, ["price", "amount"], workers=3)
+        self.assertMatchesPandas(stats)
+
+    def test_processes(self):
+        stats = load_many(self.pattern, ["price", "amount"], workers=3, processes=True)
+        self.assertMatchesPandas(stats)
+
+    def test_no_files(self):
+        pattern = os.path.join(self.tmpdir.name, "*.txt")
+        self.assertEqual(load_many(pattern, ["price"]), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
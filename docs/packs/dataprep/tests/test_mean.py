@@ -0,0 +1,101 @@
+import io
+import os
+import statistics
+import tempfile
+import unittest
+from array import array
+from contextlib import redirect_stderr, redirect_stdout
+from unittest import mock
+
+from dataprep import mean
+
+
+class TestParseLines(unittest.TestCase):
+    def test_valid(self):
+        values, malformed = mean.parse_lines(["1\n", "2.5\n", " -3 \n"])
+        self.assertEqual(values, array("d", [1.0, 2.5, -3.0]))
+        self.assertEqual(malformed, 0)
+
+    def test_empty_and_malformed(self):
+        values, malformed = mean.parse_lines(["1\n", "\n", "two\n", "3\n", "4,5\n"])
+        self.assertEqual(values, array("d", [1.0, 3.0]))
+        self.assertEqual(malformed, 2)
+
+
+class TestStream(unittest.TestCase):
+    numbers = [1000 + i % 17 for i in range(1000)]
+
+    def assertStats(self, stats, values):
+        self.assertEqual(stats.count, len(values))
+        self.assertAlmostEqual(stats.mean, statistics.fmean(values))
+        self.assertAlmostEqual(stats.variance, statistics.pvariance(values))
+
+    def test_text(self):
+        f = io.StringIO("".join(f"{n}\n" for n in self.numbers) + "x\n")
+        stats, malformed = mean.stream_text(f, batch_size=100)
+        self.assertStats(stats, self.numbers)
+        self.assertEqual(malformed, 1)
+
+    def test_text_empty(self):
+        self.assertEqual(mean.stream_text(io.StringIO("")), (None, 0))
+
+    def test_binary(self):
+        f = io.BytesIO(array("d", self.numbers).tobytes())
+        # The batches are deliberately not a multiple of 8 bytes
+        stats, rest = mean.stream_binary(f, batch_size=100)
+        self.assertStats(stats, self.numbers)
+        self.assertEqual(rest, 0)
+
+    def test_binary_incomplete(self):
+        f = io.BytesIO(array("d", self.numbers).tobytes() + b"\x00\x01\x02")
+        stats, rest = mean.stream_binary(f, batch_size=64)
+        self.assertStats(stats, self.numbers)
+        self.assertEqual(rest, 3)
+
+    def test_binary_empty(self):
+        self.assertEqual(mean.stream_binary(io.BytesIO(b"")), (None, 0))
+
+
+class TestMain(unittest.TestCase):
+    def main(self, *args, stdin=b""):
+        stdin = io.TextIOWrapper(io.BytesIO(stdin))
+        stdout, stderr = io.StringIO(), io.StringIO()
+        with (
+            mock.patch("sys.argv", ["mean", *args]),
+            mock.patch("sys.stdin", stdin),
+            redirect_stdout(stdout),
+            redirect_stderr(stderr),
+        ):
+            mean.main()
+        self.assertFalse(stdin.closed)
+        return stdout.getvalue(), stderr.getvalue()
+
+    def test_numbers(self):
+        self.assertEqual(self.main("1", "2", "4.5"), ("2.5\n", ""))
+
+    def test_no_numbers(self):
+        self.assertEqual(self.main(), ("0.0\n", ""))
+
+    def test_stdin(self):
+        self.assertEqual(
+            self.main("--file", "-", stdin=b"1\n2\nthree\n"),
+            ("1.5\n", "1 malformed lines skipped\n"),
+        )
+
+    def test_stdin_binary(self):
+        data = array("d", [1.0, 2.0]).tobytes() + b"\x00"
+        self.assertEqual(
+            self.main("--file", "-", "--binary", stdin=data),
+            ("1.5\n", "1 bytes of an incomplete value skipped\n"),
+        )
+
+    def test_file(self):
+        with tempfile.TemporaryDirectory() as tmpdir:
+            filename = os.path.join(tmpdir, "numbers.txt")
+            with open(filename, "w") as f:
+                f.write("1\n2\n3\n")
+            self.assertEqual(self.main("--file", filename), ("2.0\n", ""))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,172 @@
+import argparse
+import asyncio
+import csv
+import datetime
+import io
+import os
+import time
+
+from psycopg_pool import AsyncConnectionPool
+
+# For example "host=localhost dbname=library user=veit"
+DSN = os.environ.get("LIBRARY_DSN", "dbname=library")
+# Number of rows that a server-side cursor fetches per network round trip
+ITERSIZE = 2_000
+COLUMNS = ("title", "language", "author", "license", "release_date")
+
+
+def create_pool(dsn=DSN, min_size=1, max_size=10):
+    """Return a pool of connections that is opened with ``async with``.
+
+    Opening a connection takes several network round trips. The pool keeps
+    between min_size and max_size connections open and lends them to the
+    tasks that need them.
+    """
+    return AsyncConnectionPool(dsn, min_size=min_size, max_size=max_size, open=False)
+
+
+async def create_table(pool):
+    async with pool.connection() as conn:
+        await conn.execute("""CREATE TABLE IF NOT EXISTS books
+                              (id BIGINT GENERATED ALWAYS AS IDENTITY PRIMARY KEY,
+                               title TEXT, language TEXT, author TEXT,
+                               license TEXT, release_date DATE)""")
+
+
+async def copy_books(pool, rows):
+    """Load rows with ``COPY … FROM STDIN`` and return their number.
+
+    Unlike ``INSERT``, the rows are transferred as a single data stream without
+    a round trip per row or per statement.
+    """
+    count = 0
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            sql = f"COPY books ({', '.join(COLUMNS)}) FROM STDIN"
+            async with cursor.copy(sql) as copy:
+                for row in rows:
+                    await copy.write_row(row)
+                    count += 1
+    return count
+
+
+async def copy_csv(pool, filename):
+    """Load a CSV file such as books.csv into the books table."""
+    with open(filename, newline="", encoding="utf-8") as f:
+        return await copy_books(pool, csv.reader(f))
+
+
+async def fetch_books(pool, sql="SELECT * FROM books", params=None):
+    """Read the rows one after the other with a client-side cursor.
+
+    The server sends the entire result at once, which psycopg keeps in memory
+    until the cursor is closed.
+    """
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            await cursor.execute(sql, params)
+            while (row := await cursor.fetchone()) is not None:
+                yield row
+
+
+async def stream_books(pool, sql="SELECT * FROM books", params=None, itersize=ITERSIZE):
+    """Read the rows with a server-side cursor.
+
+    The server only sends itersize rows at a time, so that even large results
+    can be processed with constant memory.
+    """
+    async with pool.connection() as conn:
+        # Server-side cursors only exist within a transaction
+        async with conn.transaction():
+            async with conn.cursor(name="stream_books") as cursor:
+                cursor.itersize = itersize
+                await cursor.execute(sql, params)
+                async for row in cursor:
+                    yield row
+
+
+async def copy_out_books(pool):
+    """Read all books with ``COPY … TO STDOUT``."""
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            sql = f"COPY books ({', '.join(COLUMNS)}) TO STDOUT"
+            async with cursor.copy(sql) as copy:
+                copy.set_types(["text", "text", "text", "text", "date"])
+                async for row in copy.rows():
+                    yield row
+
+
+async def export_csv(pool, f):
+    """Write all books as CSV to the binary file f and return the number of
+    bytes.
+
+    The data blocks are passed on unchanged without being converted into
+    Python objects.
+    """
+    size = 0
+    async with pool.connection() as conn:
+        async with conn.cursor() as cursor:
+            sql = f"COPY books ({', '.join(COLUMNS)}) TO STDOUT (FORMAT CSV)"
+            async with cursor.copy(sql) as copy:
+                async for data in copy:
+                    size += f.write(data)
+    return size
+
+
+async def benchmark(dsn=DSN, rows=200_000):
+    """Compare the row throughput of fetchone, server-side cursors and COPY.
+
+    The books are written to a temporary table that is removed again when the
+    connection is closed, so that the benchmark does not change the database.
+    """
+    book = ("Python basics", "en", "Veit Schiele", "BSD-3-Clause")
+    release_date = datetime.date(2021, 10, 28)
+    # A temporary table is only visible to its connection
+    async with create_pool(dsn, min_size=1, max_size=1) as pool:
+        async with pool.connection() as conn:
+            await conn.execute("""CREATE TEMPORARY TABLE books
+                                  (title TEXT, language TEXT, author TEXT,
+                                   license TEXT, release_date DATE)""")
+        start = time.perf_counter()
+        await copy_books(pool, ((*book, release_date) for _ in range(rows)))
+        duration = time.perf_counter() - start
+        print(f"{'COPY FROM':20} {rows / duration:12,.0f} rows/s")
+        readers = {
+            "fetchone": fetch_books,
+            "server-side cursor": stream_books,
+            "COPY TO": copy_out_books,
+        }
+        for name, reader in readers.items():
+            start = time.perf_counter()
+            count = 0
+            async for _ in reader(pool):
+                count += 1
+            duration = time.perf_counter() - start
+            print(f"{name:20} {count / duration:12,.0f} rows/s")
+        start = time.perf_counter()
+        await export_csv(pool, io.BytesIO())
+        duration = time.perf_counter() - start
+        print(f"{'COPY TO (CSV)':20} {rows / duration:12,.0f} rows/s")
+
+
+async def main(args):
+    if args.benchmark:
+        await benchmark(args.dsn, args.rows)
+        return
+    async with create_pool(args.dsn) as pool:
+        await create_table(pool)
+        if args.csv:
+            print(f"{await copy_csv(pool, args.csv)} books loaded")
+        async for row in stream_books(pool, "SELECT * FROM books ORDER BY title"):
+            print(row)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Access the library with psycopg")
+    parser.add_argument("--dsn", default=DSN, help="connection string")
+    parser.add_argument("--csv", help="CSV file to be loaded with COPY")
+    parser.add_argument(
+        "--benchmark", action="store_true", help="compare the row throughput"
+    )
+    parser.add_argument("--rows", type=int, default=200_000)
+    asyncio.run(main(parser.parse_args()))
@@ -0,0 +1,67 @@
+import datetime
+import io
+import os
+import unittest
+
+try:
+    import library
+except ImportError:
+    library = None
+
+# For example LIBRARY_TEST_DSN="dbname=test" python -m unittest
+TEST_DSN = os.environ.get("LIBRARY_TEST_DSN")
+
+
+@unittest.skipIf(library is None, "psycopg and psycopg_pool are not installed")
+@unittest.skipUnless(TEST_DSN, "LIBRARY_TEST_DSN is not set")
+class TestLibrary(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.pool = library.create_pool(TEST_DSN, min_size=1, max_size=2)
+        await self.pool.open()
+        async with self.pool.connection() as conn:
+            await conn.execute("DROP TABLE IF EXISTS books")
+        await library.create_table(self.pool)
+        self.books = [
+            (f"Book {i:04}", "en", "Veit Schiele", "BSD-3-Clause", "2021-10-28")
+            for i in range(2_500)
+        ]
+        await library.copy_books(self.pool, self.books)
+
+    async def asyncTearDown(self):
+        async with self.pool.connection() as conn:
+            await conn.execute("DROP TABLE books")
+        await self.pool.close()
+
+    async def collect(self, rows):
+        return [row async for row in rows]
+
+    async def test_fetch_and_stream(self):
+        sql = "SELECT title FROM books ORDER BY title"
+        fetched = await self.collect(library.fetch_books(self.pool, sql))
+        streamed = await self.collect(
+            library.stream_books(self.pool, sql, itersize=100)
+        )
+        self.assertEqual(fetched, [(book[0],) for book in self.books])
+        self.assertEqual(streamed, fetched)
+
+    async def test_copy_out(self):
+        rows = await self.collect(library.copy_out_books(self.pool))
+        self.assertEqual(len(rows), len(self.books))
+        self.assertEqual(rows[0][4], datetime.date(2021, 10, 28))
+
+    async def test_export_csv(self):
+        f = io.BytesIO()
+        size = await library.export_csv(self.pool, f)
+        self.assertEqual(size, len(f.getvalue()))
+        self.assertEqual(
+            f.getvalue().splitlines()[0],
+            b"Book 0000,en,Veit Schiele,BSD-3-Clause,2021-10-28",
+        )
+
+    async def test_copy_csv(self):
+        csv_file = os.path.join(os.path.dirname(__file__), "..", "books.csv")
+        self.assertEqual(await library.copy_csv(self.pool, csv_file), 4)
+
+
+if __name__ == "__main__":
+    unittest.main()
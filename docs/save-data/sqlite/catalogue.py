@@ -0,0 +1,122 @@
+import sqlite3
+
+
+def create_catalogue(conn):
+    """Create the denormalised read table catalogue for the normalised books.
+
+    The primary key corresponds to the sort order, so that SQLite returns the
+    rows sorted without having to join and sort books and languages for each
+    query. Triggers keep the table up to date when books or languages change,
+    so only a newly created table is filled with the existing books.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'catalogue'"
+    ).fetchone()
+    with conn:
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS catalogue (
+                language_code TEXT NOT NULL,
+                title TEXT NOT NULL,
+                book_id INTEGER NOT NULL,
+                author TEXT,
+                PRIMARY KEY (language_code, title, book_id)
+            ) WITHOUT ROWID;
+
+            CREATE INDEX IF NOT EXISTS catalogue_book_idx ON catalogue(book_id);
+
+            CREATE TRIGGER IF NOT EXISTS catalogue_insert AFTER INSERT ON books
+            BEGIN
+                INSERT INTO catalogue (language_code, title, book_id, author)
+                VALUES (
+                    IFNULL((SELECT language_code FROM languages
+                            WHERE id = new.language_code), ''),
+                    IFNULL(new.title, ''), new.rowid, new.author
+                );
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS catalogue_delete AFTER DELETE ON books
+            BEGIN
+                DELETE FROM catalogue WHERE book_id = old.rowid;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS catalogue_update
+            AFTER UPDATE OF title, author, language_code ON books
+            BEGIN
+                DELETE FROM catalogue WHERE book_id = old.rowid;
+                INSERT INTO catalogue (language_code, title, book_id, author)
+                VALUES (
+                    IFNULL((SELECT language_code FROM languages
+                            WHERE id = new.language_code), ''),
+                    IFNULL(new.title, ''), new.rowid, new.author
+                );
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS catalogue_language_update
+            AFTER UPDATE OF language_code ON languages
+            BEGIN
+                UPDATE catalogue SET language_code = new.language_code
+                WHERE book_id IN (
+                    SELECT rowid FROM books WHERE language_code = new.id
+                );
+            END;
+            """)
+    if not exists:
+        refresh_catalogue(conn)
+
+
+def refresh_catalogue(conn):
+    """Fill the catalogue table again from books and languages."""
+    with conn:
+        conn.execute("DELETE FROM catalogue")
+        conn.execute("""INSERT INTO catalogue (language_code, title, book_id, author)
+                        SELECT IFNULL(languages.language_code, ''),
+                               IFNULL(books.title, ''), books.rowid, books.author
+                        FROM books
+                        LEFT JOIN languages ON books.language_code = languages.id""")
+
+
+def create_covering_index(conn):
+    """Create an index that contains all columns of the query sorted by
+    language id and title, so that the books table is not read at all."""
+    with conn:
+        conn.execute("""CREATE INDEX IF NOT EXISTS books_language_title_idx
+                        ON books(language_code, title, author)""")
+
+
+def select_page(cursor, page_size=20, after=None):
+    """Return a page of books ordered by language code and title.
+
+    Instead of skipping the first rows with ``OFFSET``, the query continues
+    after the key of the last row of the previous page (keyset pagination),
+    so that each page is read directly from the primary key. Returns the
+    rows (language_code, author, title) and the key for the next page, which
+    is None on the last page.
+    """
+    if after is None:
+        sql = """SELECT language_code, title, book_id, author FROM catalogue
+                 ORDER BY language_code, title, book_id
+                 LIMIT ?"""
+        rows = cursor.execute(sql, [page_size]).fetchall()
+    else:
+        sql = """SELECT language_code, title, book_id, author FROM catalogue
+                 WHERE (language_code, title, book_id) > (?, ?, ?)
+                 ORDER BY language_code, title, book_id
+                 LIMIT ?"""
+        rows = cursor.execute(sql, [*after, page_size]).fetchall()
+    next_key = rows[-1][:3] if len(rows) == page_size else None
+    page = [(language_code, author, title) for language_code, title, _, author in rows]
+    return page, next_key
+
+
+if __name__ == "__main__":
+    conn = sqlite3.connect("library.db")
+    create_catalogue(conn)
+    cursor = conn.cursor()
+    print("All books ordered by language code and title:")
+    key = None
+    while True:
+        page, key = select_page(cursor, page_size=2, after=key)
+        for row in page:
+            print(row)
+        if key is None:
+            break
@@ -0,0 +1,58 @@
+import sqlite3
+import threading
+from contextlib import contextmanager
+
+DATABASE = "library.db"
+# Number of prepared statements that each connection keeps for reuse
+CACHED_STATEMENTS = 256
+
+_local = threading.local()
+
+
+def get_connection(database=DATABASE):
+    """Return the connection of the current thread to the database.
+
+    The connection is opened on first use and then reused, as SQLite
+    connections must not be shared between threads by default.
+    """
+    connections = _local.__dict__.setdefault("connections", {})
+    if database not in connections:
+        connections[database] = sqlite3.connect(
+            database, cached_statements=CACHED_STATEMENTS
+        )
+    return connections[database]
+
+
+@contextmanager
+def transaction(database=DATABASE):
+    """Provide a cursor within a transaction.
+
+    The transaction is committed at the end of the outermost ``with`` block or
+    rolled back if an exception occurs. Nested calls, for example of the CRUD
+    functions within a ``with transaction():`` block, join the outer
+    transaction.
+    """
+    conn = get_connection(database)
+    depths = _local.__dict__.setdefault("depths", {})
+    depth = depths.get(database, 0)
+    depths[database] = depth + 1
+    cursor = conn.cursor()
+    try:
+        yield cursor
+        if depth == 0:
+            conn.commit()
+    except BaseException:
+        if depth == 0:
+            conn.rollback()
+        raise
+    finally:
+        cursor.close()
+        depths[database] = depth
+
+
+def close_connections():
+    """Close all connections of the current thread."""
+    connections = _local.__dict__.get("connections", {})
+    while connections:
+        _, conn = connections.popitem()
+        conn.close()
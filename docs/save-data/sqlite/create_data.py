@@ -1,15 +1,11 @@
-import sqlite3
+from connection import transaction
 
-conn = sqlite3.connect("library.db")
-cursor = conn.cursor()
-
-# insert a record into the database
-cursor.execute("""INSERT INTO books
-                  VALUES ('Python basics', 'en', 'Veit Schiele', 'BSD',
-                          '2021-10-28')""")
-
-# save data to database
-conn.commit()
+# insert a record into the database; the data is saved to the database at the
+# end of the with block
+with transaction() as cursor:
+    cursor.execute("""INSERT INTO books
+                      VALUES ('Python basics', 'en', 'Veit Schiele', 'BSD',
+                              '2021-10-28')""")
 
 # insert multiple records using the more secure "?" method
 new_books = [
@@ -17,5 +13,5 @@ new_books = [
     ("Jupyter Tutorial", "de", "Veit Schiele", "BSD-3-Clause", "2020-10-26"),
     ("PyViz Tutorial", "en", "Veit Schiele", "BSD-3-Clause", "2020-04-13"),
 ]
-cursor.executemany("INSERT INTO books VALUES (?,?,?,?,?)", new_books)
-conn.commit()
+with transaction() as cursor:
+    cursor.executemany("INSERT INTO books VALUES (?,?,?,?,?)", new_books)
@@ -1,16 +1,11 @@
-import sqlite3
+from connection import transaction
 
 
 def delete_by_language(language):
-    conn = sqlite3.connect("library.db")
-    cursor = conn.cursor()
+    with transaction() as cursor:
+        sql = "DELETE FROM books WHERE language = ?"
+        cursor.execute(sql, [language])
 
-    sql = f"""
-    DELETE FROM books
-    WHERE language = '{language}'
-    """
-    cursor.execute(sql)
-    conn.commit()
 
-
-delete_by_language(language="de")
+if __name__ == "__main__":
+    delete_by_language(language="de")
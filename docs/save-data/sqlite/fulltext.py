@@ -0,0 +1,161 @@
+import os
+import random
+import sqlite3
+import string
+import sys
+import tempfile
+import time
+
+
+def create_fts(conn):
+    """Create the full-text index books_fts for the titles of the books table.
+
+    The index does not store the titles a second time (``content='books'``),
+    but refers to the rowid of the books. Triggers keep it in sync with the
+    books table. Only a newly created index is filled with the existing books.
+    Since ``VACUUM`` can change the rowids of a table without ``INTEGER PRIMARY
+    KEY``, the index must be rebuilt after a ``VACUUM`` with
+    :func:`rebuild_fts`.
+    """
+    exists = conn.execute(
+        "SELECT 1 FROM sqlite_master WHERE name = 'books_fts'"
+    ).fetchone()
+    with conn:
+        conn.executescript("""
+            CREATE VIRTUAL TABLE IF NOT EXISTS books_fts
+            USING fts5(title, content='books', content_rowid='rowid');
+
+            CREATE TRIGGER IF NOT EXISTS books_fts_insert AFTER INSERT ON books
+            BEGIN
+                INSERT INTO books_fts(rowid, title)
+                VALUES (new.rowid, new.title);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS books_fts_delete AFTER DELETE ON books
+            BEGIN
+                INSERT INTO books_fts(books_fts, rowid, title)
+                VALUES ('delete', old.rowid, old.title);
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS books_fts_update
+            AFTER UPDATE OF title ON books
+            BEGIN
+                INSERT INTO books_fts(books_fts, rowid, title)
+                VALUES ('delete', old.rowid, old.title);
+                INSERT INTO books_fts(rowid, title)
+                VALUES (new.rowid, new.title);
+            END;
+            """)
+    if not exists:
+        rebuild_fts(conn)
+
+
+def rebuild_fts(conn):
+    """Rebuild the full-text index from the books table."""
+    with conn:
+        conn.execute("INSERT INTO books_fts(books_fts) VALUES ('rebuild')")
+
+
+def match_query(text, prefix=False):
+    """Convert text into an FTS5 query in which all words must occur.
+
+    Each word is quoted so that characters such as ``-`` or ``:`` are not
+    interpreted as FTS5 operators. With prefix, words that only begin with the
+    given words are also found.
+    """
+    words = ['"{}"'.format(word.replace('"', '""')) for word in text.split()]
+    if prefix:
+        words = [f"{word}*" for word in words]
+    return " ".join(words)
+
+
+def search(cursor, text, limit=10, prefix=False):
+    """Search the titles and return the best matches first.
+
+    Each result contains the rowid, the title with the matches in square
+    brackets, the author and the bm25 rank, where smaller values are better.
+    """
+    sql = """SELECT books.rowid,
+                    highlight(books_fts, 0, '[', ']'),
+                    books.author,
+                    bm25(books_fts) AS rank
+             FROM books_fts
+             JOIN books ON books.rowid = books_fts.rowid
+             WHERE books_fts MATCH ?
+             ORDER BY rank
+             LIMIT ?"""
+    return cursor.execute(sql, [match_query(text, prefix), limit]).fetchall()
+
+
+def snippets(cursor, text, limit=10, tokens=8):
+    """Return excerpts of at most tokens words around the matches."""
+    sql = """SELECT snippet(books_fts, 0, '[', ']', '…', ?)
+             FROM books_fts
+             WHERE books_fts MATCH ?
+             ORDER BY rank
+             LIMIT ?"""
+    rows = cursor.execute(sql, [tokens, match_query(text), limit])
+    return [snippet for (snippet,) in rows]
+
+
+def benchmark(rows=1_000_000, repeat=10):
+    """Compare the search for a word in the titles with LIKE and FTS5."""
+    random.seed(42)
+    words = [
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 10)))
+        for _ in range(50_000)
+    ]
+    with tempfile.TemporaryDirectory() as tmpdir:
+        conn = sqlite3.connect(os.path.join(tmpdir, "library.db"))
+        conn.execute("""CREATE TABLE books
+                        (title text, language text, author text, license text,
+                         release_date text)""")
+        with conn:
+            conn.executemany(
+                "INSERT INTO books VALUES (?,?,?,?,?)",
+                (
+                    (
+                        " ".join(random.choices(words, k=5)).capitalize(),
+                        "en",
+                        "Veit Schiele",
+                        "BSD-3-Clause",
+                        "2021-10-28",
+                    )
+                    for _ in range(rows)
+                ),
+            )
+        create_fts(conn)
+        cursor = conn.cursor()
+        word = words[0]
+        queries = {
+            "LIKE 'word%'": (
+                "SELECT rowid FROM books WHERE title LIKE ?",
+                [f"{word}%"],
+            ),
+            "LIKE '%word%'": (
+                "SELECT rowid FROM books WHERE title LIKE ?",
+                [f"%{word}%"],
+            ),
+            "FTS5 MATCH": (
+                """SELECT rowid FROM books_fts WHERE books_fts MATCH ?
+                   ORDER BY rank""",
+                [match_query(word)],
+            ),
+        }
+        for name, (sql, params) in queries.items():
+            start = time.perf_counter()
+            for _ in range(repeat):
+                found = len(cursor.execute(sql, params).fetchall())
+            duration = (time.perf_counter() - start) / repeat
+            print(f"{name:14} {found:4} books in {duration * 1000:8.2f} ms")
+        conn.close()
+
+
+if __name__ == "__main__":
+    if len(sys.argv) > 1 and sys.argv[1] == "--benchmark":
+        benchmark()
+    else:
+        conn = sqlite3.connect("library.db")
+        create_fts(conn)
+        for row in search(conn.cursor(), " ".join(sys.argv[1:]) or "Tutorial"):
+            print(row)
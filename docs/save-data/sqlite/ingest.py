@@ -0,0 +1,137 @@
+import csv
+import os
+import sqlite3
+import sys
+import tempfile
+import time
+from itertools import islice
+
+BATCH_SIZE = 50_000
+COLUMNS = ["title", "language", "author", "license", "release_date"]
+
+# Settings that speed up a bulk load; synchronous = OFF risks a corrupt database
+# if the operating system crashes during the load, but not if the application
+# crashes.
+LOAD_PRAGMAS = {
+    "journal_mode": "WAL",
+    "synchronous": "OFF",
+    "cache_size": -256 * 1024,  # in KiB
+    "temp_store": "MEMORY",
+}
+# Settings that are restored after the load; journal_mode = WAL is kept because
+# it is stored in the database file
+RESTORED_PRAGMAS = ["synchronous", "cache_size", "temp_store"]
+
+
+def check_schema(conn):
+    """Raise a ValueError if the books table does not have the expected
+    columns."""
+    columns = [row[1] for row in conn.execute("PRAGMA table_info(books)")]
+    if columns != COLUMNS:
+        raise ValueError(f"Unexpected columns in table books: {columns}")
+
+
+def drop_indexes(conn):
+    """Drop the indexes of the books table and return their SQL so that they
+    can be recreated after the load."""
+    indexes = conn.execute("""SELECT name, sql FROM sqlite_master
+                              WHERE type = 'index' AND tbl_name = 'books'
+                              AND sql IS NOT NULL""").fetchall()
+    for name, _ in indexes:
+        conn.execute(f'DROP INDEX "{name}"')
+    return [sql for _, sql in indexes]
+
+
+def batches(rows, batch_size):
+    """Yield lists of at most batch_size valid rows and count invalid ones."""
+    rows = iter(rows)
+    while batch := list(islice(rows, batch_size)):
+        valid = [row for row in batch if len(row) == len(COLUMNS)]
+        yield valid, len(batch) - len(valid)
+
+
+def ingest_rows(conn, rows, batch_size=BATCH_SIZE):
+    """Insert rows into the books table.
+
+    Returns the number of inserted rows, the number of rejected rows and the
+    rows per second.
+    """
+    check_schema(conn)
+    previous = {
+        name: conn.execute(f"PRAGMA {name}").fetchone()[0] for name in RESTORED_PRAGMAS
+    }
+    index_sql = []
+    inserted = rejected = 0
+    try:
+        for name, value in LOAD_PRAGMAS.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+        start = time.perf_counter()
+        index_sql = drop_indexes(conn)
+        conn.commit()
+        for batch, invalid in batches(rows, batch_size):
+            # Each batch is inserted in its own transaction
+            with conn:
+                conn.executemany("INSERT INTO books VALUES (?,?,?,?,?)", batch)
+            inserted += len(batch)
+            rejected += invalid
+    finally:
+        # Building the indexes once is faster than updating them for each row;
+        # they are also recreated if reading the rows fails
+        with conn:
+            for sql in index_sql:
+                conn.execute(sql)
+        for name, value in previous.items():
+            conn.execute(f"PRAGMA {name} = {value}")
+    duration = time.perf_counter() - start
+    return inserted, rejected, inserted / duration if duration else 0.0
+
+
+def ingest_csv(conn, filename, batch_size=BATCH_SIZE):
+    """Insert the rows of a CSV file into the books table."""
+    with open(filename, encoding="utf-8", newline="") as f:
+        reader = csv.reader(f, delimiter=",")
+        return ingest_rows(conn, reader, batch_size)
+
+
+def create_books(filename):
+    """Create a database with an empty, indexed books table."""
+    conn = sqlite3.connect(filename)
+    conn.execute("""CREATE TABLE books
+                    (title text, language text, author text, license text,
+                     release_date text)""")
+    conn.execute("CREATE INDEX books_author ON books(author)")
+    return conn
+
+
+def generate_books(count):
+    """Yield count rows of books."""
+    for i in range(count):
+        yield (
+            f"Python basics {i}",
+            "en",
+            "Veit Schiele",
+            "BSD-3-Clause",
+            "2021-10-28",
+        )
+
+
+def benchmark(count=1_000_000):
+    """Load count generated books from a CSV file into a new database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "books.csv")
+        with open(filename, "w", encoding="utf-8", newline="") as f:
+            csv.writer(f).writerows(generate_books(count))
+        conn = create_books(os.path.join(tmpdir, "library.db"))
+        inserted, rejected, rate = ingest_csv(conn, filename)
+        conn.close()
+    print(f"{inserted} rows inserted, {rejected} rejected ({rate:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == "--benchmark":
+        benchmark()
+    else:
+        conn = sqlite3.connect("library.db")
+        inserted, rejected, rate = ingest_csv(conn, sys.argv[1])
+        print(f"{inserted} rows inserted, {rejected} rejected ({rate:.0f} rows/s)")
+        conn.close()
@@ -0,0 +1,55 @@
+import os
+import sqlite3
+import sys
+import tempfile
+
+from ingest import BATCH_SIZE, create_books, ingest_rows
+
+# xml_stream.py is located in the parent directory
+sys.path.append(os.path.join(os.path.dirname(os.path.abspath(__file__)), ".."))
+from xml_stream import iter_books, write_catalog  # noqa: E402
+
+# Child elements of <book> in the order of the columns of the books table
+TAGS = ["title", "language", "author", "license", "date"]
+
+
+def iter_rows(source, tag="book"):
+    """Yield a row for the books table for each book element.
+
+    The books are read with ``iter_books`` from ``xml_stream.py``, so that the
+    document is never completely in memory. Missing child elements result in
+    NULL values.
+    """
+    for book in iter_books(source, tag):
+        yield tuple(book.get(name) for name in TAGS)
+
+
+def ingest_xml(conn, source, batch_size=BATCH_SIZE):
+    """Insert the books of an XML catalogue into the books table.
+
+    Returns the number of inserted rows, the number of rejected rows and the
+    rows per second.
+    """
+    return ingest_rows(conn, iter_rows(source), batch_size)
+
+
+def benchmark(count=1_000_000):
+    """Load count generated books from an XML file into a new database."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "books.xml")
+        with open(filename, "wb") as f:
+            write_catalog(f, count)
+        conn = create_books(os.path.join(tmpdir, "library.db"))
+        inserted, rejected, rate = ingest_xml(conn, filename)
+        conn.close()
+    print(f"{inserted} rows inserted, {rejected} rejected ({rate:.0f} rows/s)")
+
+
+if __name__ == "__main__":
+    if sys.argv[1] == "--benchmark":
+        benchmark()
+    else:
+        conn = sqlite3.connect("library.db")
+        inserted, rejected, rate = ingest_xml(conn, sys.argv[1])
+        print(f"{inserted} rows inserted, {rejected} rejected ({rate:.0f} rows/s)")
+        conn.close()
@@ -0,0 +1,114 @@
+import sqlite3
+import sys
+import time
+
+BATCH_SIZE = 10_000
+MIGRATION = "languages"
+
+
+def prepare(conn):
+    """Create the languages table, the new column and the triggers.
+
+    All steps can be repeated, so that an interrupted migration can simply be
+    restarted.
+    """
+    # In WAL mode, readers are not blocked by the migration
+    conn.execute("PRAGMA journal_mode = WAL")
+    with conn:
+        conn.execute("""CREATE TABLE IF NOT EXISTS languages
+                        (id INTEGER PRIMARY KEY AUTOINCREMENT,
+                        language_code VARCHAR(2))""")
+        conn.execute("""CREATE UNIQUE INDEX IF NOT EXISTS languages_code_idx
+                        ON languages(language_code)""")
+        conn.execute("""CREATE TABLE IF NOT EXISTS migrations
+                        (name TEXT PRIMARY KEY, position INTEGER)""")
+        # Derive the languages from the books instead of listing them
+        conn.execute("""INSERT OR IGNORE INTO languages (language_code)
+                        SELECT DISTINCT language FROM books
+                        WHERE language IS NOT NULL""")
+        columns = [row[1] for row in conn.execute("PRAGMA table_info(books)")]
+        if "language_code" not in columns:
+            # Adding a column does not copy the table
+            conn.execute("""ALTER TABLE books ADD COLUMN
+                            language_code INTEGER REFERENCES languages(id)""")
+        # Books inserted or changed during the migration are kept up to date
+        conn.executescript("""
+            CREATE TRIGGER IF NOT EXISTS books_language_insert
+            AFTER INSERT ON books WHEN new.language IS NOT NULL
+            BEGIN
+                INSERT OR IGNORE INTO languages (language_code)
+                VALUES (new.language);
+                UPDATE books SET language_code = (
+                    SELECT id FROM languages
+                    WHERE language_code = new.language
+                ) WHERE rowid = new.rowid;
+            END;
+
+            CREATE TRIGGER IF NOT EXISTS books_language_update
+            AFTER UPDATE OF language ON books WHEN new.language IS NOT NULL
+            BEGIN
+                INSERT OR IGNORE INTO languages (language_code)
+                VALUES (new.language);
+                UPDATE books SET language_code = (
+                    SELECT id FROM languages
+                    WHERE language_code = new.language
+                ) WHERE rowid = new.rowid;
+            END;
+            """)
+
+
+def backfill(conn, batch_size=BATCH_SIZE, pause=0.0, max_batches=None):
+    """Set language_code for existing books in batches of batch_size rows.
+
+    Each batch is committed together with its position in the migrations
+    table, so that the migration continues from there after an interruption.
+    pause gives other writers the opportunity to access the database between
+    the batches. Returns the number of processed batches.
+    """
+    (last_rowid,) = conn.execute("SELECT IFNULL(MAX(rowid), 0) FROM books").fetchone()
+    row = conn.execute(
+        "SELECT position FROM migrations WHERE name = ?", [MIGRATION]
+    ).fetchone()
+    position = row[0] if row else 0
+    batches = 0
+    while position < last_rowid and batches != max_batches:
+        end = position + batch_size
+        with conn:
+            # Requires SQLite ≥ 3.33.0 for UPDATE … FROM
+            conn.execute(
+                """UPDATE books SET language_code = languages.id
+                   FROM languages
+                   WHERE languages.language_code = books.language
+                   AND books.rowid > ? AND books.rowid <= ?""",
+                [position, end],
+            )
+            conn.execute(
+                "INSERT OR REPLACE INTO migrations VALUES (?, ?)", [MIGRATION, end]
+            )
+        position = end
+        batches += 1
+        time.sleep(pause)
+    return batches
+
+
+def drop_language(conn):
+    """Remove the old language column after the backfill.
+
+    Unlike the other steps, SQLite rewrites the entire table for this, so that
+    it should be carried out at a quiet time.
+    """
+    with conn:
+        conn.execute("DROP TRIGGER IF EXISTS books_language_insert")
+        conn.execute("DROP TRIGGER IF EXISTS books_language_update")
+        # Only SQLite ≥ 3.35.0 allows DROP COLUMN
+        conn.execute("ALTER TABLE books DROP COLUMN language")
+        conn.execute("DELETE FROM migrations WHERE name = ?", [MIGRATION])
+
+
+if __name__ == "__main__":
+    conn = sqlite3.connect("library.db")
+    prepare(conn)
+    print(f"{backfill(conn)} batches processed")
+    if "--drop-language" in sys.argv:
+        drop_language(conn)
+    conn.close()
@@ -1,7 +1,4 @@
-import sqlite3
-
-conn = sqlite3.connect("library.db")
-cursor = conn.cursor()
+from connection import transaction
 
 
 def select_all_records_from_author(cursor, author):
@@ -19,13 +16,14 @@ def select_all_records_sorted_by_author(cursor):
 
 def select_using_like(cursor, text):
     print(f"All books with {text} in the title:")
-    sql = f"""
+    sql = """
     SELECT * FROM books
-    WHERE title LIKE '{text}%'"""
-    cursor.execute(sql)
+    WHERE title LIKE ?"""
+    cursor.execute(sql, [f"{text}%"])
     print(cursor.fetchall())
 
 
-select_all_records_from_author(cursor, author="Veit Schiele")
-select_all_records_sorted_by_author(cursor)
-select_using_like(cursor, text="Python")
+with transaction() as cursor:
+    select_all_records_from_author(cursor, author="Veit Schiele")
+    select_all_records_sorted_by_author(cursor)
+    select_using_like(cursor, text="Python")
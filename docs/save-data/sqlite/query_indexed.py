@@ -0,0 +1,127 @@
+import sqlite3
+import sys
+import time
+
+INDEXES = {
+    "books_author_idx": "books(author)",
+    "books_title_idx": "books(title)",
+    "books_release_date_idx": "books(release_date)",
+}
+
+
+def create_indexes(conn):
+    """Create the indexes if they do not yet exist and update the statistics
+    that the query planner uses to select an index."""
+    with conn:
+        for name, columns in INDEXES.items():
+            conn.execute(f"CREATE INDEX IF NOT EXISTS {name} ON {columns}")
+    conn.execute("ANALYZE")
+
+
+def prefix_range(prefix):
+    """Return the smallest string that is greater than all strings starting
+    with prefix, or None if there is none."""
+    while prefix:
+        last = ord(prefix[-1])
+        if last < 0x10FFFF:
+            # Surrogates cannot be encoded in UTF-8 and therefore cannot occur
+            # in the database
+            following = 0xE000 if last == 0xD7FF else last + 1
+            return prefix[:-1] + chr(following)
+        prefix = prefix[:-1]
+    return None
+
+
+def select_all_records_from_author(cursor, author):
+    sql = "SELECT * FROM books WHERE author = ?"
+    return cursor.execute(sql, [author]).fetchall()
+
+
+def select_all_records_sorted_by_author(cursor):
+    # The index on author already returns the rows sorted
+    sql = "SELECT rowid, * FROM books ORDER BY author"
+    return cursor.execute(sql).fetchall()
+
+
+def select_by_release_date(cursor, start, end):
+    sql = """SELECT * FROM books
+             WHERE release_date >= ? AND release_date < ?
+             ORDER BY release_date"""
+    return cursor.execute(sql, [start, end]).fetchall()
+
+
+def select_title_prefix_sql(prefix):
+    """Return the SQL and parameters of a query for titles starting with
+    prefix.
+
+    Unlike ``LIKE 'prefix%'``, the range condition can use the index on
+    title; however, it distinguishes between upper and lower case.
+    """
+    upper = prefix_range(prefix)
+    if upper is None:
+        return "SELECT * FROM books WHERE title >= ? ORDER BY title", [prefix]
+    sql = "SELECT * FROM books WHERE title >= ? AND title < ? ORDER BY title"
+    return sql, [prefix, upper]
+
+
+def select_title_prefix(cursor, prefix):
+    sql, params = select_title_prefix_sql(prefix)
+    return cursor.execute(sql, params).fetchall()
+
+
+def explain(cursor, sql, params=()):
+    """Return the steps of the query plan, for example
+    ``SEARCH books USING INDEX books_author_idx (author=?)``."""
+    plan = cursor.execute(f"EXPLAIN QUERY PLAN {sql}", params).fetchall()
+    return [detail for _, _, _, detail in plan]
+
+
+def benchmark(count=1_000_000, prefix="Python basics 99999", repeat=10):
+    """Compare the duration of the range condition and LIKE for a table with
+    count books."""
+    from ingest import generate_books
+
+    conn = sqlite3.connect(":memory:")
+    conn.execute("""CREATE TABLE books
+                    (title text, language text, author text, license text,
+                     release_date text)""")
+    with conn:
+        conn.executemany("INSERT INTO books VALUES (?,?,?,?,?)", generate_books(count))
+    create_indexes(conn)
+    cursor = conn.cursor()
+    queries = {
+        "range": select_title_prefix_sql(prefix),
+        "LIKE": (
+            "SELECT * FROM books WHERE title LIKE ? ORDER BY title",
+            [f"{prefix}%"],
+        ),
+    }
+    for name, (sql, params) in queries.items():
+        start = time.perf_counter()
+        for _ in range(repeat):
+            rows = cursor.execute(sql, params).fetchall()
+        duration = (time.perf_counter() - start) / repeat
+        print(f"{name:6} {len(rows):3} rows {duration * 1e3:8.3f} ms")
+    conn.close()
+
+
+if __name__ == "__main__":
+    if sys.argv[1:] == ["--benchmark"]:
+        benchmark()
+    else:
+        conn = sqlite3.connect("library.db")
+        create_indexes(conn)
+        cursor = conn.cursor()
+
+        print("All books from Veit Schiele:")
+        print(select_all_records_from_author(cursor, author="Veit Schiele"))
+        print(explain(cursor, "SELECT * FROM books WHERE author = ?", ["Veit Schiele"]))
+
+        print("Listing of all books sorted by author:")
+        for row in select_all_records_sorted_by_author(cursor):
+            print(row)
+        print(explain(cursor, "SELECT rowid, * FROM books ORDER BY author"))
+
+        print("All books with Python at the beginning of the title:")
+        print(select_title_prefix(cursor, "Python"))
+        print(explain(cursor, *select_title_prefix_sql("Python")))
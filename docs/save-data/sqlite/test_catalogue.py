@@ -0,0 +1,88 @@
+import sqlite3
+import unittest
+from unittest import mock
+
+import catalogue
+
+
+class TestCatalogue(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.executescript("""
+            CREATE TABLE languages
+            (id INTEGER PRIMARY KEY AUTOINCREMENT, language_code VARCHAR(2));
+            INSERT INTO languages (language_code) VALUES ('en'), ('de');
+            CREATE TABLE books (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                title TEXT,
+                language_code INTEGER REFERENCES languages(id),
+                author TEXT,
+                license TEXT,
+                release_date DATE
+            );
+            """)
+        self.insert("Python basics", 1)
+        self.insert("Jupyter Tutorial", 1)
+        self.insert("Jupyter Tutorial", 2)
+        catalogue.create_catalogue(self.conn)
+        self.cursor = self.conn.cursor()
+
+    def insert(self, title, language_code):
+        with self.conn:
+            self.conn.execute(
+                """INSERT INTO books (title, language_code, author)
+                   VALUES (?, ?, 'Veit Schiele')""",
+                [title, language_code],
+            )
+
+    def all_pages(self, page_size):
+        rows, key = [], None
+        while True:
+            page, key = catalogue.select_page(self.cursor, page_size, key)
+            rows.extend(page)
+            if key is None:
+                return rows
+
+    def expected(self):
+        return self.conn.execute("""SELECT languages.language_code, books.author,
+                                           books.title
+                                    FROM books
+                                    JOIN languages
+                                    ON (books.language_code = languages.id)
+                                    ORDER BY languages.language_code, title,
+                                             books.rowid""").fetchall()
+
+    def test_create_again(self):
+        with mock.patch.object(catalogue, "refresh_catalogue") as refresh:
+            catalogue.create_catalogue(self.conn)
+        refresh.assert_not_called()
+        self.assertEqual(self.all_pages(2), self.expected())
+
+    def test_pages(self):
+        for page_size in (1, 2, 3, 10):
+            with self.subTest(page_size=page_size):
+                self.assertEqual(self.all_pages(page_size), self.expected())
+
+    def test_triggers(self):
+        self.insert("PyViz Tutorial", 2)
+        with self.conn:
+            self.conn.execute("UPDATE books SET title = 'Python' WHERE id = 1")
+            self.conn.execute("DELETE FROM books WHERE id = 2")
+            self.conn.execute("UPDATE languages SET language_code = 'EN' WHERE id = 1")
+        self.assertEqual(self.all_pages(2), self.expected())
+
+    def test_page_uses_primary_key(self):
+        plan = self.conn.execute(
+            """EXPLAIN QUERY PLAN
+                                    SELECT * FROM catalogue
+                                    WHERE (language_code, title, book_id) > (?, ?, ?)
+                                    ORDER BY language_code, title, book_id
+                                    LIMIT 10""",
+            ["de", "", 0],
+        ).fetchall()
+        self.assertIn("PRIMARY KEY", plan[0][3])
+        self.assertNotIn("TEMP B-TREE", " ".join(row[3] for row in plan))
+
+
+if __name__ == "__main__":
+    unittest.main()
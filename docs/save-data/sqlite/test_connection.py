@@ -0,0 +1,55 @@
+import os
+import sqlite3
+import tempfile
+import threading
+import unittest
+
+import connection
+
+
+class TestConnection(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.database = os.path.join(self.tmpdir.name, "library.db")
+        with connection.transaction(self.database) as cursor:
+            cursor.execute("CREATE TABLE books (title text, license text)")
+
+    def tearDown(self):
+        connection.close_connections()
+        self.tmpdir.cleanup()
+
+    def count(self):
+        conn = sqlite3.connect(self.database)
+        (count,) = conn.execute("SELECT COUNT(*) FROM books").fetchone()
+        conn.close()
+        return count
+
+    def test_same_connection_per_thread(self):
+        conn = connection.get_connection(self.database)
+        self.assertIs(connection.get_connection(self.database), conn)
+        other = []
+        thread = threading.Thread(
+            target=lambda: other.append(connection.get_connection(self.database))
+        )
+        thread.start()
+        thread.join()
+        self.assertIsNot(other[0], conn)
+
+    def test_nested_transactions_commit_once(self):
+        with connection.transaction(self.database):
+            for i in range(3):
+                with connection.transaction(self.database) as cursor:
+                    cursor.execute("INSERT INTO books VALUES (?, 'BSD')", [i])
+            self.assertEqual(self.count(), 0)
+        self.assertEqual(self.count(), 3)
+
+    def test_rollback(self):
+        with self.assertRaises(ZeroDivisionError):
+            with connection.transaction(self.database) as cursor:
+                cursor.execute("INSERT INTO books VALUES ('Python basics', 'BSD')")
+                1 / 0
+        self.assertEqual(self.count(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
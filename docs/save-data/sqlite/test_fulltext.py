@@ -0,0 +1,60 @@
+import sqlite3
+import unittest
+from unittest import mock
+
+import fulltext
+
+
+class TestFulltext(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("""CREATE TABLE books
+                             (title text, language text, author text,
+                              license text, release_date text)""")
+        self.conn.execute("""INSERT INTO books
+                             VALUES ('Python basics', 'en', 'Veit Schiele',
+                                     'BSD', '2021-10-28')""")
+        fulltext.create_fts(self.conn)
+        self.cursor = self.conn.cursor()
+
+    def titles(self, text, **kwargs):
+        return [row[1] for row in fulltext.search(self.cursor, text, **kwargs)]
+
+    def test_existing_rows_are_indexed(self):
+        self.assertEqual(self.titles("basics"), ["Python [basics]"])
+
+    def test_create_again(self):
+        with mock.patch.object(fulltext, "rebuild_fts") as rebuild_fts:
+            fulltext.create_fts(self.conn)
+        rebuild_fts.assert_not_called()
+        self.assertEqual(self.titles("basics"), ["Python [basics]"])
+
+    def test_insert_update_delete(self):
+        with self.conn:
+            self.conn.execute("""INSERT INTO books
+                                 VALUES ('PyViz Tutorial', 'en', 'Veit Schiele',
+                                         'BSD', '2020-04-13')""")
+        self.assertEqual(self.titles("tutorial"), ["PyViz [Tutorial]"])
+        with self.conn:
+            self.conn.execute(
+                "UPDATE books SET title = 'Jupyter Tutorial' WHERE title = ?",
+                ["PyViz Tutorial"],
+            )
+        self.assertEqual(self.titles("pyviz"), [])
+        self.assertEqual(self.titles("tutorial"), ["Jupyter [Tutorial]"])
+        with self.conn:
+            self.conn.execute("DELETE FROM books WHERE title = 'Jupyter Tutorial'")
+        self.assertEqual(self.titles("tutorial"), [])
+
+    def test_prefix(self):
+        self.assertEqual(self.titles("pyth"), [])
+        self.assertEqual(self.titles("pyth", prefix=True), ["[Python] basics"])
+
+    def test_operators_are_quoted(self):
+        self.assertEqual(fulltext.match_query('a-b "c"'), '"a-b" """c"""')
+        # Without quoting, "-python" would be a syntax error
+        self.assertEqual(self.titles("basics -python"), ["[Python] [basics]"])
+
+
+if __name__ == "__main__":
+    unittest.main()
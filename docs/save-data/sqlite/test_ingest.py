@@ -0,0 +1,75 @@
+import csv
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import ingest
+
+
+class TestIngest(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.tmpdir.name, "library.db"))
+        self.conn.execute("""CREATE TABLE books
+                             (title text, language text, author text,
+                              license text, release_date text)""")
+        self.conn.execute("CREATE INDEX books_author ON books(author)")
+        self.filename = os.path.join(self.tmpdir.name, "books.csv")
+        with open(self.filename, "w", encoding="utf-8") as f:
+            f.write("Python basics,en,Veit Schiele,BSD-3-Clause,2021-10-28\n")
+            f.write("incomplete,row\n")
+            f.write("PyViz Tutorial,en,Veit Schiele,BSD-3-Clause,2020-04-13\n")
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmpdir.cleanup()
+
+    def test_ingest_csv(self):
+        inserted, rejected, _ = ingest.ingest_csv(self.conn, self.filename, 1)
+        self.assertEqual((inserted, rejected), (2, 1))
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM books").fetchone(), (2,)
+        )
+
+    def test_indexes_are_recreated(self):
+        ingest.ingest_csv(self.conn, self.filename)
+        indexes = self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        ).fetchall()
+        self.assertEqual(indexes, [("books_author",)])
+
+    def test_indexes_are_recreated_after_error(self):
+        def rows():
+            yield ["Python basics", "en", "Veit Schiele", "BSD-3-Clause", "2021"]
+            raise csv.Error("unexpected end of data")
+
+        with self.assertRaises(csv.Error):
+            ingest.ingest_rows(self.conn, rows(), 1)
+        indexes = self.conn.execute(
+            "SELECT name FROM sqlite_master WHERE type = 'index'"
+        ).fetchall()
+        self.assertEqual(indexes, [("books_author",)])
+        self.assertEqual(
+            self.conn.execute("SELECT COUNT(*) FROM books").fetchone(), (1,)
+        )
+
+    def test_pragmas_are_restored(self):
+        self.conn.execute("PRAGMA synchronous = FULL")
+        self.conn.execute("PRAGMA cache_size = -4096")
+        ingest.ingest_csv(self.conn, self.filename)
+        pragmas = [
+            self.conn.execute(f"PRAGMA {name}").fetchone()[0]
+            for name in ingest.RESTORED_PRAGMAS
+        ]
+        self.assertEqual(pragmas, [2, -4096, 0])
+
+    def test_wrong_schema(self):
+        self.conn.execute("DROP TABLE books")
+        self.conn.execute("CREATE TABLE books (title text)")
+        with self.assertRaises(ValueError):
+            ingest.ingest_csv(self.conn, self.filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
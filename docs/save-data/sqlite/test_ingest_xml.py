@@ -0,0 +1,41 @@
+import io
+import os
+import sqlite3
+import tempfile
+import unittest
+
+import ingest_xml
+
+BOOKS_XML = os.path.join(os.path.dirname(__file__), "..", "books.xml")
+
+
+class TestIngestXml(unittest.TestCase):
+    def setUp(self):
+        self.tmpdir = tempfile.TemporaryDirectory()
+        self.conn = sqlite3.connect(os.path.join(self.tmpdir.name, "library.db"))
+        self.conn.execute("""CREATE TABLE books
+                             (title text, language text, author text,
+                              license text, release_date text)""")
+
+    def tearDown(self):
+        self.conn.close()
+        self.tmpdir.cleanup()
+
+    def test_ingest_xml(self):
+        inserted, rejected, _ = ingest_xml.ingest_xml(self.conn, BOOKS_XML, 3)
+        self.assertEqual((inserted, rejected), (4, 0))
+        self.assertEqual(
+            self.conn.execute("SELECT * FROM books").fetchone(),
+            ("Python basics", "en", "Veit Schiele", "BSD-3-Clause", "2021-10-28"),
+        )
+
+    def test_missing_elements(self):
+        f = io.BytesIO(b"<catalog><book><title>Python basics</title></book></catalog>")
+        self.assertEqual(
+            list(ingest_xml.iter_rows(f)),
+            [("Python basics", None, None, None, None)],
+        )
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import sqlite3
+import unittest
+
+import migrate_languages
+
+
+class TestMigrateLanguages(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("""CREATE TABLE books
+                             (title text, language text, author text,
+                              license text, release_date text)""")
+        self.conn.executemany(
+            "INSERT INTO books VALUES (?, ?, 'Veit Schiele', 'BSD', '2021')",
+            [(f"Book {i}", ["de", "en", "fr"][i % 3]) for i in range(25)],
+        )
+        migrate_languages.prepare(self.conn)
+
+    def language_codes(self):
+        return self.conn.execute("""SELECT books.language, languages.language_code
+                                    FROM books
+                                    LEFT JOIN languages
+                                    ON books.language_code = languages.id""").fetchall()
+
+    def test_languages_are_derived(self):
+        codes = self.conn.execute("SELECT language_code FROM languages").fetchall()
+        self.assertEqual(sorted(codes), [("de",), ("en",), ("fr",)])
+
+    def test_backfill_is_resumable(self):
+        batches = migrate_languages.backfill(self.conn, batch_size=10, max_batches=1)
+        self.assertEqual(batches, 1)
+        self.assertIn(("fr", None), self.language_codes())
+        # Prepare and backfill again as after an interruption
+        migrate_languages.prepare(self.conn)
+        batches = migrate_languages.backfill(self.conn, batch_size=10)
+        self.assertEqual(batches, 2)
+        for language, code in self.language_codes():
+            self.assertEqual(language, code)
+
+    def test_new_books_during_migration(self):
+        with self.conn:
+            self.conn.execute(
+                "INSERT INTO books (title, language) VALUES ('Neu', 'it')"
+            )
+            self.conn.execute("UPDATE books SET language = 'es' WHERE rowid = 1")
+        codes = dict(self.language_codes())
+        self.assertEqual(codes["it"], "it")
+        self.assertEqual(codes["es"], "es")
+
+    def test_drop_language(self):
+        migrate_languages.backfill(self.conn)
+        migrate_languages.drop_language(self.conn)
+        columns = [row[1] for row in self.conn.execute("PRAGMA table_info(books)")]
+        self.assertNotIn("language", columns)
+        self.assertIn("language_code", columns)
+
+
+if __name__ == "__main__":
+    unittest.main()
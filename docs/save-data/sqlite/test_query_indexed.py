@@ -0,0 +1,66 @@
+import sqlite3
+import unittest
+
+import query_indexed
+
+
+class TestQueryIndexed(unittest.TestCase):
+    def setUp(self):
+        self.conn = sqlite3.connect(":memory:")
+        self.conn.execute("""CREATE TABLE books
+                             (title text, language text, author text,
+                              license text, release_date text)""")
+        self.conn.executemany(
+            "INSERT INTO books VALUES (?,?,?,?,?)",
+            [
+                ("Python basics", "en", "Veit Schiele", "BSD", "2021-10-28"),
+                ("PyViz Tutorial", "en", "Veit Schiele", "BSD", "2020-04-13"),
+                ("Pythonic code", "en", "Jane Doe", "MIT", "2022-01-01"),
+                ("python lowercase", "en", "Jane Doe", "MIT", "2023-01-01"),
+            ],
+        )
+        # With statistics for only a few rows, a scan would be cheaper
+        self.conn.executemany(
+            "INSERT INTO books VALUES (?,?,?,?,?)",
+            [
+                (f"Book {i}", "de", f"Author {i}", "MIT", "2000-01-01")
+                for i in range(100)
+            ],
+        )
+        query_indexed.create_indexes(self.conn)
+        self.cursor = self.conn.cursor()
+
+    def test_prefix_range(self):
+        self.assertEqual(query_indexed.prefix_range("Python"), "Pythoo")
+        self.assertEqual(query_indexed.prefix_range("a\U0010ffff"), "b")
+        self.assertIsNone(query_indexed.prefix_range(""))
+        # The surrogates between U+D7FF and U+E000 are skipped
+        self.assertEqual(query_indexed.prefix_range("a\ud7ff"), "a\ue000")
+
+    def test_select_title_prefix_before_surrogates(self):
+        titles = ["\ud7ff", "\ud7ffa", "\ue000", "\ue000a"]
+        self.conn.executemany(
+            "INSERT INTO books (title) VALUES (?)", [(title,) for title in titles]
+        )
+        rows = query_indexed.select_title_prefix(self.cursor, "\ud7ff")
+        self.assertEqual([row[0] for row in rows], ["\ud7ff", "\ud7ffa"])
+
+    def test_select_title_prefix(self):
+        rows = query_indexed.select_title_prefix(self.cursor, "Python")
+        titles = [row[0] for row in rows]
+        self.assertEqual(titles, ["Python basics", "Pythonic code"])
+
+    def test_queries_use_indexes(self):
+        queries = [
+            ("SELECT * FROM books WHERE author = ?", ["Jane Doe"]),
+            ("SELECT rowid, * FROM books ORDER BY author", []),
+            query_indexed.select_title_prefix_sql("Python"),
+        ]
+        for sql, params in queries:
+            with self.subTest(sql=sql):
+                plan = query_indexed.explain(self.cursor, sql, params)
+                self.assertIn("USING INDEX", plan[0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,16 +1,11 @@
-import sqlite3
+from connection import transaction
 
 
 def update_license(old_name, new_name):
-    conn = sqlite3.connect("library.db")
-    cursor = conn.cursor()
-    sql = f"""
-    UPDATE books
-    SET license = '{new_name}'
-    WHERE license = '{old_name}'
-    """
-    cursor.execute(sql)
-    conn.commit()
+    with transaction() as cursor:
+        sql = "UPDATE books SET license = ? WHERE license = ?"
+        cursor.execute(sql, [new_name, old_name])
 
 
-update_license(old_name="BSD", new_name="BSD-3-Clause")
+if __name__ == "__main__":
+    update_license(old_name="BSD", new_name="BSD-3-Clause")
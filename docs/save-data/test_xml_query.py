@@ -0,0 +1,50 @@
+import gc
+import os
+import unittest
+import xml.etree.ElementTree as ET
+
+import xml_query
+
+BOOKS_XML = os.path.join(os.path.dirname(__file__), "books.xml")
+
+
+class TestXmlQuery(unittest.TestCase):
+    def setUp(self):
+        self.tree = ET.parse(BOOKS_XML)
+
+    def test_lookup(self):
+        books = xml_query.lookup(self.tree, "book", "title", "Jupyter Tutorial")
+        self.assertEqual([book.get("id") for book in books], ["2", "3"])
+        self.assertEqual(xml_query.lookup(self.tree, "book", "title", "Nope"), [])
+
+    def test_lookup_one(self):
+        book = xml_query.lookup_one(self.tree, "book", "@id", "4")
+        self.assertEqual(book.findtext("title"), "PyViz Tutorial")
+        self.assertIsNone(xml_query.lookup_one(self.tree, "book", "@id", "5"))
+
+    def test_text_key(self):
+        index = xml_query.index(self.tree, "book/language", ".")
+        self.assertEqual(sorted(index), ["de", "en"])
+        self.assertEqual(len(index["en"]), 3)
+
+    def test_index_is_cached(self):
+        index = xml_query.index(self.tree, "book", "@id")
+        self.assertIs(xml_query.index(self.tree.getroot(), "book", "@id"), index)
+
+    def test_invalidate(self):
+        root = self.tree.getroot()
+        self.assertIsNone(xml_query.lookup_one(root, "book", "@id", "5"))
+        ET.SubElement(root, "book", id="5")
+        xml_query.invalidate(root)
+        self.assertIsNotNone(xml_query.lookup_one(root, "book", "@id", "5"))
+
+    def test_index_is_released(self):
+        xml_query.index(self.tree, "book", "@id")
+        count = len(xml_query._indexes)
+        del self.tree
+        gc.collect()
+        self.assertEqual(len(xml_query._indexes), count - 1)
+
+
+if __name__ == "__main__":
+    unittest.main()
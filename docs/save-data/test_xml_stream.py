@@ -0,0 +1,62 @@
+import io
+import os
+import tracemalloc
+import unittest
+
+import xml_stream
+
+BOOKS_XML = os.path.join(os.path.dirname(__file__), "books.xml")
+
+
+class TestXmlStream(unittest.TestCase):
+    def test_iter_books(self):
+        books = list(xml_stream.iter_books(BOOKS_XML))
+        self.assertEqual(len(books), 4)
+        self.assertEqual(
+            books[0],
+            {
+                "id": "1",
+                "title": "Python basics",
+                "language": "en",
+                "author": "Veit Schiele",
+                "license": "BSD-3-Clause",
+                "date": "2021-10-28",
+            },
+        )
+
+    def test_iter_titles(self):
+        self.assertEqual(
+            list(xml_stream.iter_titles(BOOKS_XML)),
+            ["Python basics", "Jupyter Tutorial", "Jupyter Tutorial", "PyViz Tutorial"],
+        )
+
+    def test_nested_books(self):
+        f = io.BytesIO(b"""<catalog><section name="a">
+                             <book id="1"><title>A</title></book>
+                             <book id="2"><title>B</title></book>
+                           </section></catalog>""")
+        self.assertEqual(list(xml_stream.iter_titles(f)), ["A", "B"])
+
+    def test_nested_books_are_removed(self):
+        f = io.BytesIO()
+        xml_stream.write_catalog(f, 20_000)
+        # Move the books into a section below the root element
+        data = f.getvalue().replace(b"<catalog>", b"<catalog><section>")
+        f = io.BytesIO(data.replace(b"</catalog>", b"</section></catalog>"))
+        tracemalloc.start()
+        for _ in xml_stream.iter_books(f):
+            pass
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        self.assertLess(peak, 2**20)
+
+    def test_write_catalog(self):
+        f = io.BytesIO()
+        xml_stream.write_catalog(f, 3)
+        f.seek(0)
+        ids = [book["id"] for book in xml_stream.iter_books(f)]
+        self.assertEqual(ids, ["0", "1", "2"])
+
+
+if __name__ == "__main__":
+    unittest.main()
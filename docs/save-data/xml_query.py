@@ -0,0 +1,105 @@
+import argparse
+import functools
+import io
+import time
+import weakref
+import xml.etree.ElementTree as ET
+
+from xml_stream import write_catalog
+
+# Indexes per document; they are removed together with the document
+_indexes = weakref.WeakKeyDictionary()
+
+
+@functools.lru_cache(maxsize=128)
+def compile_key(key):
+    """Return a function that determines the key of an element.
+
+    ``@name`` selects the attribute name, any other key the text of the first
+    child element with this path, for example ``author``.
+    """
+    if key.startswith("@"):
+        name = key[1:]
+        return lambda elem: elem.get(name)
+    if key == ".":
+        return lambda elem: elem.text
+    return lambda elem: elem.findtext(key)
+
+
+def _root(document):
+    if isinstance(document, ET.ElementTree):
+        return document.getroot()
+    return document
+
+
+def index(document, path, key):
+    """Return a dict that assigns the elements found with path to their key.
+
+    The document is only searched on the first call for a combination of path
+    and key; subsequent calls return the cached dict. If the document is
+    changed, the indexes must be discarded with :func:`invalidate`.
+    """
+    root = _root(document)
+    indexes = _indexes.setdefault(root, {})
+    if (path, key) not in indexes:
+        get_key = compile_key(key)
+        elements = {}
+        for elem in root.iterfind(path):
+            elements.setdefault(get_key(elem), []).append(elem)
+        indexes[path, key] = elements
+    return indexes[path, key]
+
+
+def lookup(document, path, key, value):
+    """Return all elements found with path whose key has the value."""
+    return index(document, path, key).get(value, [])
+
+
+def lookup_one(document, path, key, value):
+    """Return the first element whose key has the value or None."""
+    elements = lookup(document, path, key, value)
+    return elements[0] if elements else None
+
+
+def invalidate(document):
+    """Discard the indexes of a document after it has been changed."""
+    _indexes.pop(_root(document), None)
+
+
+def benchmark(count=10_000, lookups=1_000):
+    """Compare lookups by id with find and with the cached index."""
+    f = io.BytesIO()
+    write_catalog(f, count)
+    f.seek(0)
+    root = ET.parse(f).getroot()
+    ids = [str(i * count // lookups) for i in range(lookups)]
+
+    start = time.perf_counter()
+    for book_id in ids:
+        root.find(f"book[@id='{book_id}']")
+    duration = time.perf_counter() - start
+    print(f"{'find':18} {duration / lookups * 1e6:10.1f} µs per lookup")
+
+    start = time.perf_counter()
+    index(root, "book", "@id")
+    print(f"{'build index':18} {(time.perf_counter() - start) * 1e3:10.1f} ms")
+
+    start = time.perf_counter()
+    for book_id in ids:
+        lookup_one(root, "book", "@id", book_id)
+    duration = time.perf_counter() - start
+    print(f"{'lookup_one':18} {duration / lookups * 1e6:10.1f} µs per lookup")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Look up books in an XML file")
+    parser.add_argument("file", nargs="?", default="books.xml")
+    parser.add_argument("--author", default="Veit Schiele")
+    parser.add_argument("--benchmark", type=int, metavar="COUNT")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark)
+    else:
+        tree = ET.parse(args.file)
+        for book in lookup(tree, "book", "author", args.author):
+            print(book.get("id"), book.findtext("title"))
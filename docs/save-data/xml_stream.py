@@ -0,0 +1,106 @@
+import argparse
+import contextlib
+import os
+import tempfile
+import time
+import tracemalloc
+import xml.etree.ElementTree as ET
+
+
+def iter_books(source, tag="book"):
+    """Yield the elements with the name tag as dicts without reading the entire
+    document into memory.
+
+    source can be a file name or a file object opened in binary mode. Each dict
+    contains the attributes of the element and the texts of its child
+    elements.
+    """
+    # Elements whose end has not yet been reached
+    parents = []
+    for event, elem in ET.iterparse(source, events=("start", "end")):
+        if event == "start":
+            parents.append(elem)
+            continue
+        parents.pop()
+        if elem.tag == tag:
+            record = dict(elem.attrib)
+            for child in elem:
+                record[child.tag] = child.text
+            yield record
+            # Processed elements are removed from their parent so that the
+            # memory requirement remains constant, however deeply the elements
+            # are nested
+            elem.clear()
+            if parents:
+                parents[-1].remove(elem)
+
+
+def iter_titles(source):
+    """Yield all titles found in source."""
+    for book in iter_books(source):
+        yield book.get("title")
+
+
+def write_catalog(f, count):
+    """Write a catalogue with count books to the binary file f."""
+    f.write(b'<?xml version="1.0"?>\n<catalog>\n')
+    for i in range(count):
+        f.write(f"""   <book id="{i}">
+      <title>Python basics {i}</title>
+      <language>en</language>
+      <author>Veit Schiele</author>
+      <license>BSD-3-Clause</license>
+      <date>2021-10-28</date>
+   </book>
+""".encode())
+    f.write(b"</catalog>\n")
+
+
+def measure(function, *args):
+    """Return the duration in seconds and the peak memory usage in bytes of
+    function; output to stdout is discarded."""
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        start = time.perf_counter()
+        function(*args)
+        duration = time.perf_counter() - start
+        # Tracing slows down the execution, so the memory is measured in a
+        # second run
+        tracemalloc.start()
+        function(*args)
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+    return duration, peak
+
+
+def benchmark(count=20_000):
+    """Compare iter_books with getTitles and parseXML."""
+    from elementtree_example import parseXML
+    from minidom_example import getTitles
+
+    functions = {
+        "minidom getTitles": getTitles,
+        "ElementTree parseXML": parseXML,
+        "iterparse iter_titles": lambda source: list(iter_titles(source)),
+        "iterparse iter_books": lambda source: sum(1 for _ in iter_books(source)),
+    }
+    with tempfile.TemporaryDirectory() as tmpdir:
+        filename = os.path.join(tmpdir, "books.xml")
+        with open(filename, "wb") as f:
+            write_catalog(f, count)
+        size = os.path.getsize(filename)
+        print(f"{count:,} books, {size / 2**20:.1f} MiB")
+        for name, function in functions.items():
+            duration, peak = measure(function, filename)
+            print(f"{name:22} {duration:7.3f} s {peak / 2**20:8.1f} MiB")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Read books from an XML file")
+    parser.add_argument("file", nargs="?", default="books.xml")
+    parser.add_argument("--benchmark", type=int, metavar="COUNT")
+    args = parser.parse_args()
+    if args.benchmark:
+        benchmark(args.benchmark)
+    else:
+        for book in iter_books(args.file):
+            print(book)